@@ -1,27 +1,32 @@
 import pygame
 import random
 import math
-
-pygame.init()
-
-
-def load_word_list(filename):
-    words = []
-    try:
-        with open(filename, "r", encoding="utf-8") as f:
-            for line in f:
-                w = line.strip().lower()
-                if w:
-                    words.append(w)
-    except FileNotFoundError:
-        print(f"Warning: {filename} not found, using empty list.")
-    return words
+import string
+import time
+import bisect
+import operator
+import os
+from array import array
+
+# import ได้ทั้งแบบ flat (รันจากโฟลเดอร์นี้) และแบบ Final_game_model.Game_model (launcher/เครื่องมือที่รันจาก root)
+if __package__:
+    from .audio import NullAudio, create_audio
+    from .profiler import FrameProfiler
+    from .running_stats import RunningStats
+    from .text_cache import text_cache
+    from .word_dictionary import CategoryRegistry
+else:
+    from audio import NullAudio, create_audio
+    from profiler import FrameProfiler
+    from running_stats import RunningStats
+    from text_cache import text_cache
+    from word_dictionary import CategoryRegistry
+
+# import ไฟล์นี้ต้องไม่เปิดจอ/โหลดเสียง/โหลดรูป ทั้งหมดย้ายไปอยู่ใน init() และโหลดตอนใช้ครั้งแรก
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Text or Die")
-
 
 WHITE = (255, 255, 255)
 BLACK = (10, 12, 24)
@@ -32,45 +37,298 @@ RED = (255, 80, 80)
 GREEN = (80, 255, 120)
 YELLOW = (255, 255, 120)
 
-FONT = pygame.font.SysFont("arial", 28)
-BIG = pygame.font.SysFont("arial", 56)
-clock = pygame.time.Clock()
-questions = {
-    "Name a fruit": load_word_list("fruits.txt"),
-    "Name a country": load_word_list("countries.txt"),
-    "Name an animal": load_word_list("animals.txt")
-}
+FONT_SIZE = 28
+BIG_SIZE = 56
+
+# ตั้งค่าใน init()
+screen = None
+clock = None
+audio = NullAudio()
+FONT = None
+BIG = None
+
+_fonts = {}
+_questions = None
+
+
+def get_font(size):
+    font = _fonts.get(size)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.SysFont("arial", size)
+        _fonts[size] = font
+    return font
+
+
+# ทุกไฟล์ .txt/.csv/.jsonl ในโฟลเดอร์ words/ คือหนึ่งหมวด (words/fruits.txt -> "Name a fruit")
+# แยกโฟลเดอร์ไว้ ไฟล์อื่นข้างโค้ด (เช่น profile.csv จาก TOD_PROFILE_OUT) จะได้ไม่กลายเป็นหมวด
+# และไม่ไปเปลี่ยนว่า seed ของ replay เก่าสุ่มได้หมวดไหน
+WORDS_DIR = os.path.join(ASSET_DIR, "words")
+
+
+def new_game_rng(questions, seed):
+    # rng ของเกมมาจาก seed เดียว หมวดแรกสุ่มจากมันก่อน replay.py ใช้ seed เดิมก็ได้หมวด/การสุ่มเดิมทั้งเกม
+    rng = random.Random(seed)
+    return rng, rng.choice(questions.names())
+
+
+def get_questions():
+    # สแกนแค่ชื่อไฟล์ ตัวคำศัพท์โหลดตอนหมวดนั้นถูกใช้ครั้งแรก
+    global _questions
+    if _questions is None:
+        _questions = CategoryRegistry(WORDS_DIR)
+    return _questions
+
+
+class BackgroundLayer:
+    # รูปพื้นหลังหนึ่งชั้น: convert เป็น pixel format ของจอครั้งเดียว แล้วเก็บรูปที่ scale แล้วแยกตามขนาดหน้าต่าง
+    # parallax = เลื่อนตามกล้องกี่เท่า (0 = อยู่กับที่)
+    # tile = ต่อรูปซ้ำแนวตั้ง (ใช้กับรูปที่ต่อกันได้เนียน) ไม่งั้นเหนือรูปจะถมด้วยสีแถวบนสุดของรูป (ท้องฟ้า)
+    def __init__(self, filename, parallax=0.0, tile=False, alpha=False):
+        self.filename = filename
+        self.parallax = parallax
+        self.tile = tile
+        self.alpha = alpha
+        self.image = None
+        self.top_color = BLACK
+        self.failed = False
+        self.scaled = {}
+
+    def _load(self):
+        # ต้องเรียกหลังเปิดจอแล้ว เพราะ convert() ต้องรู้ pixel format ของจอ
+        try:
+            image = pygame.image.load(os.path.join(ASSET_DIR, self.filename))
+            self.image = image.convert_alpha() if self.alpha else image.convert()
+            top_row = pygame.Rect(0, 0, self.image.get_width(), 1)
+            self.top_color = pygame.transform.average_color(self.image, top_row)
+        except Exception as e:
+            print(f"Warning: background {self.filename} not found or failed to load:", e)
+            self.failed = True
+
+    def surface_for(self, size):
+        if self.image is None and not self.failed:
+            self._load()
+        if self.failed:
+            return None
+        scaled = self.scaled.get(size)
+        if scaled is None:
+            scaled = pygame.transform.smoothscale(self.image, size)
+            self.scaled[size] = scaled
+        return scaled
+
+    def draw(self, surface, camera_y):
+        image = self.surface_for(surface.get_size())
+        if image is None:
+            return False
+        # ใช้ int(camera_y) ให้ตรงกับที่ DirtyRectRenderer ใช้ตัดสินว่ากล้องขยับหรือยัง
+        offset = int(-int(camera_y) * self.parallax)
+        if not self.tile:
+            offset = max(0, offset)
+            if offset > 0:
+                surface.fill(self.top_color, pygame.Rect(0, 0, surface.get_width(), offset))
+            surface.blit(image, (0, offset))
+            return True
+        h = image.get_height()
+        y = offset % h - h
+        view_h = surface.get_height()
+        while y < view_h:
+            surface.blit(image, (0, y))
+            y += h
+        return True
+
+
+background_layers = [BackgroundLayer("Bg1.png", parallax=0.25)]
+
+
+def draw_background(surface, camera_y):
+    drawn = False
+    for layer in background_layers:
+        drawn = layer.draw(surface, camera_y) or drawn
+    if not drawn:
+        surface.fill(BLACK)
+
+
+def init(audio_enabled=True):
+    # เสียงยังไม่เริ่มตรงนี้ main() จะเรียก audio.start() หลังวาดเฟรมแรก
+    global screen, clock, FONT, BIG, audio
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Text or Die")
+    clock = pygame.time.Clock()
+    FONT = get_font(FONT_SIZE)
+    BIG = get_font(BIG_SIZE)
+    glyph_cache.prerender()
+
+    audio = create_audio(ASSET_DIR, audio_enabled)
+    return screen
 
-pygame.mixer.init()
-pygame.mixer.music.load("music.mp3") 
-pygame.mixer.music.play(-1,0.0)
 
 # ขนาดบล็อกกกกกกก
 block_width = 50
 block_height = 30
 
 
+class GlyphCache:
+    # เรนเดอร์ตัวอักษรครั้งเดียวแล้วเก็บไว้ใช้ซ้ำ ไม่ต้อง FONT.render ทุกเฟรม
+    def __init__(self, font_size=FONT_SIZE, color=BLACK):
+        self.font_size = font_size
+        self.color = color
+        self.glyphs = {}
+
+    def prerender(self, letters=string.ascii_uppercase):
+        for ch in letters:
+            self.get(ch)
+
+    def get(self, letter):
+        glyph = self.glyphs.get(letter)
+        if glyph is None:
+            glyph = get_font(self.font_size).render(letter, True, self.color)
+            self.glyphs[letter] = glyph
+        return glyph
+
+    def clear(self):
+        self.glyphs.clear()
+
+
+glyph_cache = GlyphCache()
+
+
+class BlockSpriteCache:
+    # รวมพื้น + ขอบ + ตัวอักษรเป็นรูปเดียวตอนสร้างบล็อก ตอนวาดเหลือ blit ครั้งเดียว
+    def __init__(self, glyphs, border_color=(100, 100, 100)):
+        self.glyphs = glyphs
+        self.border_color = border_color
+        self.sprites = {}
+        self.allocations = 0
+
+    def get(self, letter, color, width, height):
+        key = (letter, color, width, height)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            self.allocations += 1
+            sprite = pygame.Surface((width, height)).convert()
+            rect = sprite.get_rect()
+            pygame.draw.rect(sprite, color, rect)
+            pygame.draw.rect(sprite, self.border_color, rect, 2)
+            text = self.glyphs.get(letter)
+            sprite.blit(text, text.get_rect(center=rect.center))
+            self.sprites[key] = sprite
+        return sprite
+
+    def clear(self):
+        self.sprites.clear()
+
+
+block_sprites = BlockSpriteCache(glyph_cache)
+
+
 class Block:
+    # บล็อกเดี่ยว ๆ (ตึกเก็บเป็น array แล้ว ดู Tower) ขนาดเท่ากันทุกก้อนเลยเป็นค่าของคลาส ไม่ต้องเก็บทุกก้อน
+    __slots__ = ("x", "y", "letter", "color", "sprite")
+    width = block_width
+    height = block_height
+
     def __init__(self, x, y, letter, color=GREY):
         self.x = x
         self.y = y
         self.letter = letter.upper()
-        self.width = block_width
-        self.height = block_height
         self.color = color
+        # สร้าง sprite ตอนวาดครั้งแรก เกมแบบ headless จะได้ไม่ต้องมีจอ
+        self.sprite = None
 
     def draw(self, screen, camera_y):
-        rect = pygame.Rect(self.x, self.y - camera_y, self.width, self.height)
-        pygame.draw.rect(screen, self.color, rect)
-        pygame.draw.rect(screen, (100, 100, 100), rect, 2)
-        text = FONT.render(self.letter, True, BLACK)
-        text_rect = text.get_rect(center=rect.center)
-        screen.blit(text, text_rect)
+        if self.sprite is None:
+            self.sprite = block_sprites.get(self.letter, self.color, self.width, self.height)
+        screen.blit(self.sprite, (self.x, self.y - camera_y))
+
+
+class SurfacePool:
+    # surface ที่ต้องใช้ทุกเฟรม สร้างครั้งเดียวที่ขนาดใหญ่สุดแล้วใช้ซ้ำ ไม่ต้อง new ทุกเฟรม
+    def __init__(self):
+        self.filled = {}
+        self.scratch_surfaces = {}
+        self.allocations = 0
+
+    def get(self, size, fill, flags=pygame.SRCALPHA):
+        # surface สีพื้นเดียว ไม่มีใครวาดทับ เก็บไว้ใช้ได้เลย
+        key = (size, fill, flags)
+        surf = self.filled.get(key)
+        if surf is None:
+            self.allocations += 1
+            surf = pygame.Surface(size, flags)
+            surf.fill(fill)
+            self.filled[key] = surf
+        return surf
+
+    def scratch(self, size, flags=pygame.SRCALPHA):
+        # surface ไว้วาดชั่วคราว ล้างให้โปร่งใสก่อนคืนทุกครั้ง
+        key = (size, flags)
+        surf = self.scratch_surfaces.get(key)
+        if surf is None:
+            self.allocations += 1
+            surf = pygame.Surface(size, flags)
+            self.scratch_surfaces[key] = surf
+        else:
+            surf.fill((0, 0, 0, 0))
+        return surf
+
+    def clear(self):
+        self.filled.clear()
+        self.scratch_surfaces.clear()
+
+
+surface_pool = SurfacePool()
+
+
+def surface_allocations():
+    # นับ surface ที่สร้างใหม่ทั้งหมดจาก cache/pool ถ้าเลขนี้ขึ้นทุกเฟรมแปลว่ามีที่ยังไม่ได้ cache
+    return (surface_pool.allocations + block_sprites.allocations
+            + len(glyph_cache.glyphs) + text_cache.misses)
+
+
+# เปิด profiler ด้วย TOD_PROFILE=1 (หรือกด F3 ระหว่างเล่น) ตอนปิดเกมจะเขียนผลลง TOD_PROFILE_OUT (.csv/.json) ถ้าตั้งไว้
+PROFILE = os.environ.get("TOD_PROFILE", "") not in ("", "0")
+PROFILE_OUT = os.environ.get("TOD_PROFILE_OUT")
+PROFILER_KEY = pygame.K_F3
+
+# ทุกเกมบันทึก replay ไว้ (ไฟล์ละไม่กี่ร้อย byte) ปิดได้ด้วย TOD_REPLAY=0 ดู replay.py
+RECORD_REPLAYS = os.environ.get("TOD_REPLAY", "1") not in ("", "0")
+REPLAY_DIR = os.environ.get("TOD_REPLAY_DIR", os.path.join(ASSET_DIR, "replays"))
+profiler = FrameProfiler(enabled=PROFILE, alloc_counter=surface_allocations)
+
+
+SINE_TABLE_SIZE = 4096  # ต้องเป็นกำลังของ 2 จะได้ใช้ & แทน %
+_SINE_TABLE = [math.sin(2 * math.pi * i / SINE_TABLE_SIZE) for i in range(SINE_TABLE_SIZE)]
+
+
+class WaveLayer:
+    # คลื่นหนึ่งชั้น: คิดเฟสของแต่ละ x ไว้ก่อน ตอนวาดแค่เลื่อนเฟสตามเวลาแล้วเปิดตาราง sin
+    def __init__(self, amp, wave_len, speed, step, x_end, offset=0.0):
+        to_index = SINE_TABLE_SIZE / (2 * math.pi)
+        xs = range(0, x_end, step)
+        self.phase = [round(x / wave_len * to_index) % SINE_TABLE_SIZE for x in xs]
+        self.speed = speed * to_index
+        self.offset = offset
+        # ต่อตารางสองรอบ phase + shift จะได้ไม่เกินขอบโดยไม่ต้อง mask ทุกจุด
+        table = [v * amp for v in _SINE_TABLE]
+        self.table = table + table
+        self.points = [[x, 0.0] for x in xs]
+
+    def points_at(self, t, base_y):
+        shift = int(t * self.speed) & (SINE_TABLE_SIZE - 1)
+        y0 = base_y + self.offset
+        table = self.table
+        ys = [y0 + table[p + shift] for p in self.phase]
+        for point, y in zip(self.points, ys):
+            point[1] = y
+        return self.points
 
 
 class Water:
-    def __init__(self, screen_h, start_level=None, anim_dur=0.9, color=BLUE):
+    def __init__(self, screen_h, start_level=None, anim_dur=0.9, color=BLUE, width=WIDTH):
         self.screen_h = screen_h
+        self.width = width
         self.level = float(start_level if start_level is not None else screen_h)  # world y
 
         self.start_y = self.level
@@ -80,7 +338,12 @@ class Water:
         self.animating = False
         self.color = color
 
-        self.word_lengths = []
+        self.word_stats = RunningStats()
+
+        # จำนวนจุดคลื่นตามความกว้าง จอแบ่งหลายคนแต่ละช่องแคบลง ค่าวาดรวมเลยเท่าเดิม
+        self.back_wave = WaveLayer(amp=14, wave_len=150, speed=2.0, step=8, x_end=width + 8)
+        self.front_wave = WaveLayer(amp=16, wave_len=240, speed=2.0, step=6, x_end=width + 6, offset=-2)
+        self.highlight_wave = WaveLayer(amp=2.0, wave_len=60.0, speed=2.0, step=12, x_end=width + 6)
 
     def rise(self, amount_px):
         if amount_px <= 0:
@@ -105,59 +368,41 @@ class Water:
             self.level = self.target_y
             self.animating = False
 
-    def draw(self, surface, camera_y=0):
-
-        screen_y = int(self.level - camera_y)
+    def draw(self, surface, camera_y=0, level=None):
+        # level ส่งมาได้ถ้าอยากวาดที่ตำแหน่ง interpolate ระหว่าง step
+        if level is None:
+            level = self.level
+        screen_y = int(level - camera_y)
         height = max(0, self.screen_h - screen_y)
         if height <= 0:
             return
 
         # เปลี่ยนน้ำเป็นแบบพื้นเรียบนะค๊ะพี่
-        water_surf = pygame.Surface((WIDTH, height), pygame.SRCALPHA)
+        # ใช้ surface สูงเต็มจอใบเดียว แล้ว blit แค่ส่วนที่น้ำท่วม
         if len(self.color) == 3:
             fill_color = (*self.color, 200)
         else:
             fill_color = self.color
-        water_surf.fill(fill_color)
-        surface.blit(water_surf, (0, screen_y))
+        water_surf = surface_pool.get((self.width, self.screen_h), fill_color)
+        body_y = max(0, screen_y)
+        surface.blit(water_surf, (0, body_y), pygame.Rect(0, 0, self.width, self.screen_h - body_y))
 
         # เส้นคลื่นหลัง
         t = pygame.time.get_ticks() / 1000.0
-        points_back = []
-        amp_back = 14
-        wave_len_back = 150
-        speed_back = 2.0
-        for x in range(0, WIDTH + 8, 8):
-            y = screen_y + math.sin((x / wave_len_back) + t * speed_back) * amp_back
-            points_back.append((x, y))
+        points_back = self.back_wave.points_at(t, screen_y)
         if len(points_back) > 1:
             pygame.draw.lines(surface, (120, 180, 255), False, points_back, 2)
 
         # เส้นคลื่นหน้า
-        points_front = []
-        amp_front = 16
-        wave_len_front = 240
-        speed_front = 2.0
-        for x in range(0, WIDTH + 6, 6):
-            y = screen_y + math.sin((x / wave_len_front) + t * speed_front) * amp_front - 2
-            points_front.append((x, y))
+        points_front = self.front_wave.points_at(t, screen_y)
         if len(points_front) > 1:
             pygame.draw.lines(surface, (180, 220, 255), False, points_front, 2)
 
-
-        hl_points = []
-        for x in range(0, WIDTH + 6, 12):
-            y = screen_y + math.sin((x / 60.0) + t * 2.0) * 2.0 - 6
-            hl_points.append((x, y))
+        # ไฮไลต์วาดบน surface สูง 24px เลยคิด y เทียบกับขอบบนของ surface นั้น
+        hl_points = self.highlight_wave.points_at(t, 0)
         if len(hl_points) > 1:
-            s = pygame.Surface((WIDTH, 24), pygame.SRCALPHA)
-            pygame.draw.lines(
-                s,
-                (255, 255, 255, 60),
-                False,
-                [(p[0], p[1] - screen_y + 6) for p in hl_points],
-                3
-            )
+            s = surface_pool.scratch((self.width, 24))
+            pygame.draw.lines(s, (255, 255, 255, 60), False, hl_points, 3)
             surface.blit(s, (0, screen_y - 12))
 
     def is_animating(self):
@@ -170,33 +415,101 @@ class Water:
             self.target_y = self.level
             self.anim_time = 0.0
             self.animating = False
-            self.word_lengths = []
+            self.word_stats.reset()
 
 
 
-blocks = []
+# สีบล็อกในตึกเก็บเป็นเลข index ของ list นี้ (ไม่เกิน 256 สี)
+BLOCK_PALETTE = [GREY]
 
 
-def add_word_blocks(word):
-    word = word.strip()
-    if word == "":
-        return
-    if len(blocks) == 0:
-        base_top_y = HEIGHT - 130 - block_height
-    else:
-        current_top = min(b.y for b in blocks)
-        base_top_y = current_top - block_height
-    x_center = WIDTH // 2 - block_width // 2
-    for i, ch in enumerate(word):
-        y = base_top_y - i * block_height
-        blocks.append(Block(x_center, y, ch))
+class Tower:
+    # ตึกเก็บแบบ array ต่อคอลัมน์ ไม่สร้าง object ต่อตัวอักษร: y, รหัสตัวอักษร, index สี
+    # x/กว้าง/สูงเท่ากันทุกก้อนเลยเก็บค่าเดียว ตึกล้านตัวอักษรใช้เมมแค่ ~9 byte ต่อก้อน
+    # ขอบบน/ล่างอัปเดตตอนเพิ่มคำ ไม่ต้อง min/max ทั้งตึกทุกเฟรม
+    def __init__(self, base_y=HEIGHT - 130, x=WIDTH // 2 - block_width // 2, palette=BLOCK_PALETTE):
+        self.base_y = base_y
+        self.x = x
+        self.palette = palette
+        self.ys = array("i")
+        self.letters = array("I")
+        self.colors = array("B")
+        self.top_y = None
+        self.bottom_y = None
+        self.letter_count = 0
+        self.sprites = {}  # (รหัสตัวอักษร << 8 | index สี) -> sprite
+
+    def __len__(self):
+        return len(self.ys)
+
+    def add_word(self, word, color=0):
+        word = word.strip()
+        if word == "":
+            return
+        if self.top_y is None:
+            base_top_y = self.base_y - block_height
+            self.bottom_y = base_top_y
+        else:
+            base_top_y = self.top_y - block_height
+        n = len(word)
+        self.ys.extend(range(base_top_y, base_top_y - n * block_height, -block_height))
+        upper = word.upper()
+        if len(upper) != n:
+            # ตัวอย่าง ß -> SS ยาวไม่เท่าเดิม เลยต้องทำทีละตัว
+            upper = [ch.upper()[0] for ch in word]
+        self.letters.extend(map(ord, upper))
+        self.colors.extend(array("B", [color]) * n)
+        self.top_y = base_top_y - (n - 1) * block_height
+        self.letter_count += n
+
+    def letter_at(self, i):
+        return chr(self.letters[i])
+
+    def block(self, i):
+        # ไว้ดู/ดีบักทีละก้อน ตอนวาดไม่ได้ใช้
+        return Block(self.x, self.ys[i], self.letter_at(i), self.palette[self.colors[i]])
+
+    def clear(self):
+        del self.ys[:]
+        del self.letters[:]
+        del self.colors[:]
+        self.top_y = None
+        self.bottom_y = None
+        self.letter_count = 0
+
+    def visible_range(self, camera_y, view_h=HEIGHT):
+        # บล็อกใหม่อยู่บนบล็อกเก่าเสมอ ys เลยเรียงจากมากไปน้อย ใช้ bisect หาช่วงที่อยู่ในจอ
+        lo = bisect.bisect_right(self.ys, -(camera_y + view_h), key=operator.neg)
+        hi = bisect.bisect_left(self.ys, block_height - camera_y, key=operator.neg)
+        return range(lo, hi)
+
+    def _sprite(self, key):
+        sprite = block_sprites.get(chr(key >> 8), self.palette[key & 0xFF], block_width, block_height)
+        self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen, camera_y):
+        # ถ้ามี clip (วาดแค่ dirty rect) ก็ไล่แค่บล็อกที่อยู่ในช่วง clip
+        clip = screen.get_clip()
+        ys, letters, colors = self.ys, self.letters, self.colors
+        sprites = self.sprites
+        x = self.x
+        jobs = []
+        for i in self.visible_range(camera_y + clip.top, clip.height):
+            key = letters[i] << 8 | colors[i]
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = self._sprite(key)
+            jobs.append((sprite, (x, ys[i] - camera_y)))
+        screen.blits(jobs, False)
 
 
 def draw_text(surface, text, font, color, x, y):
-    txt = font.render(text, True, color)
+    txt = text_cache.render(font, text, color)
     surface.blit(txt, (x, y))
-def draw_text_box(surface, text, font, text_color, box_color, x, y, padding=6):
-    txt = font.render(text, True, text_color)
+
+
+def blit_text_box(surface, txt, box_color, x, y, padding=6):
     rect = txt.get_rect(topleft=(x, y))
 
     # background box (transparent)
@@ -207,210 +520,552 @@ def draw_text_box(surface, text, font, text_color, box_color, x, y, padding=6):
     surface.blit(txt, rect)
 
 
+def draw_text_box(surface, text, font, text_color, box_color, x, y, padding=6):
+    txt = text_cache.render(font, text, text_color)
+    blit_text_box(surface, txt, box_color, x, y, padding)
 
 
-def main():
-    running = True
-    input_text = ""
-
-    
-    chosen_category = random.choice(list(questions.keys()))
-    current_question = questions[chosen_category]
-
-    camera_y = 0
-    camera_target_y = 0
-
-    water = Water(screen_h=HEIGHT, start_level=HEIGHT - 100, anim_dur=0.9)
-    WATER_RISE_PIXELS_PER_LETTER = block_height
-
-    round_number = 1
-    PERCENT_START = 0.50
-    PERCENT_STEP = 0.10
-
-    score = 0
-    game_over = False
-
-    submitted_words = set() 
-
-    info_text = ""
-    info_time = 0.0
-    INFO_DURATION = 2.0
+class HudText:
+    # ช่อง HUD หนึ่งช่อง จำค่าล่าสุดไว้ render ใหม่เฉพาะตอนค่าเปลี่ยน
+    def __init__(self, fmt, font_size, color, x, y, box_color=None):
+        self.fmt = fmt
+        self.font_size = font_size
+        self.color = color
+        self.x = x
+        self.y = y
+        self.box_color = box_color
+        self.value = None
+        self.surf = None
+
+    def draw(self, surface, value):
+        if self.surf is None or value != self.value:
+            self.value = value
+            self.surf = text_cache.render(get_font(self.font_size), self.fmt.format(value), self.color)
+        if self.box_color is None:
+            surface.blit(self.surf, (self.x, self.y))
+        else:
+            blit_text_box(surface, self.surf, self.box_color, self.x, self.y)
+
+
+HUD_BOX_COLOR = (255, 255, 255, 200)
+hud_category = HudText("Category: {}", FONT_SIZE, BLACK, 20, 80, HUD_BOX_COLOR)
+hud_score = HudText("Score: {}", FONT_SIZE, GREEN, WIDTH - 200, 100, HUD_BOX_COLOR)
+hud_round = HudText("Round: {}", FONT_SIZE, LIGHT_BLUE, WIDTH - 200, 150, HUD_BOX_COLOR)
+hud_input = HudText("{}", FONT_SIZE, BLUE, 30, 30)
+hud_final_score = HudText("Final Score: {}", FONT_SIZE, WHITE, WIDTH // 2 - 120, HEIGHT // 2)
+
+
+PERCENT_START = 0.50
+PERCENT_STEP = 0.10
+WATER_RISE_PIXELS_PER_LETTER = block_height
+INFO_DURATION = 2.0
+
+# เกมเดินทีละ FIXED_DT เท่ากันเสมอ ไม่ว่าจะวาดกี่ FPS (RENDER_FPS ตั้งต่ำลงได้เพื่อประหยัดไฟ)
+FIXED_DT = 1.0 / 60.0
+MAX_FRAME_DT = 0.25
+RENDER_FPS = 60
+# กล้องเข้าหาเป้าแบบ exponential: เหลือระยะ exp(-CAMERA_RATE * dt) ต่อ dt (60 FPS = เลื่อน 12% ต่อเฟรมเท่าเดิม)
+CAMERA_RATE = -math.log(1 - 0.12) * 60
+
+# โหมดพิมพ์ผิดได้นิดหน่อย: คำที่ห่างจากคำในหมวดไม่เกิน FUZZY_MAX_DISTANCE ตัว นับเป็นคำนั้นแต่หักคะแนน
+# ผิดได้ 1 ตัวต่อทุก 4 ตัวอักษรของคำในหมวด (fuzzy.CHARS_PER_EDIT) คำในหมวดที่ไม่ถึง 4 ตัวต้องพิมพ์ถูกเป๊ะ
+FUZZY_MATCHING = False
+FUZZY_MAX_DISTANCE = 2
+FUZZY_PENALTY = 0.5  # หักกี่ส่วนของคะแนนคำนั้น
+
+
+class GameState:
+    # ตรรกะเกมทั้งหมดแยกออกจาก main() ไม่ใช้จอ เสียง หรือ clock
+    # เวลาเดินตาม dt ที่ส่งเข้ามาอย่างเดียว ใส่ rng ที่ seed แล้วจะได้ผลเหมือนเดิมทุกรอบ
+    def __init__(self, questions, rng=None, percent_start=PERCENT_START, percent_step=PERCENT_STEP,
+                 rise_per_letter=WATER_RISE_PIXELS_PER_LETTER, view_h=HEIGHT, category=None,
+                 fuzzy=FUZZY_MATCHING, fuzzy_distance=FUZZY_MAX_DISTANCE, fuzzy_penalty=FUZZY_PENALTY,
+                 view_w=WIDTH, water=None):
+        self.questions = questions
+        self.fuzzy = fuzzy
+        self.fuzzy_distance = fuzzy_distance
+        self.fuzzy_penalty = fuzzy_penalty
+        self.rng = rng if rng is not None else random.Random()
+        self.percent_start = percent_start
+        self.percent_step = percent_step
+        self.rise_per_letter = rise_per_letter
+        self.view_h = view_h
+        self.view_w = view_w
+
+        self.tower = Tower(base_y=view_h - 130, x=view_w // 2 - block_width // 2)
+        # ส่ง water มาได้ถ้าหลายคนใช้น้ำร่วมกัน (splitscreen.py) คนส่งมาเป็นคน update/reset เอง
+        self.owns_water = water is None
+        if water is None:
+            water = Water(screen_h=view_h, start_level=view_h - 100, anim_dur=0.9, width=view_w)
+        self.water = water
+        self.time = 0.0
+        self.submitted_words = set()
+        self.events = []
+        self.restart(category)
+
+    def restart(self, category=None):
+        self.tower.clear()
+        self.input_text = ""
+        if category is None:
+            category = self.rng.choice(list(self.questions.keys()))
+        self.chosen_category = category
+        self.current_question = self.questions[self.chosen_category]
+        # trie (กับ fuzzy index) main โหลดไว้ให้แล้วใน thread (questions.preload) ตรงนี้แค่หยิบมาใช้
+        self.prefix = self.current_question.cursor()
+        if self.fuzzy:
+            # ยังไม่มีก็สร้างตอนเริ่มรอบ กด Enter จะได้ไม่กระตุก
+            self.current_question.fuzzy_index(self.fuzzy_distance)
+        if self.owns_water:
+            self.water.reset(start_level=self.view_h - 100)
+        self.round_number = 1
+        self.score = 0
+        self.camera_y = 0
+        self.camera_target_y = 0
+        self.prev_camera_y = 0
+        self.prev_water_level = self.water.level
+        self.game_over = False
+        self.submitted_words.clear()
+        self.info_text = ""
+        self.info_time = 0.0
+
+    def next_category(self):
+        # หมวดที่ restart() ครั้งหน้าจะสุ่มได้ สุ่มจากสำเนาของ rng ตัวจริงเลยไม่ขยับ (replay ยังตรงเหมือนเดิม)
+        peek = random.Random()
+        peek.setstate(self.rng.getstate())
+        return peek.choice(list(self.questions.keys()))
+
+    def _emit(self, name):
+        # เหตุการณ์ในเกม (correct/wrong/already_used/game_over) ให้ข้างนอกเอาไปเล่นเสียงต่อ
+        self.events.append(name)
+
+    def pop_events(self):
+        events = self.events
+        self.events = []
+        return events
+
+    def _end_game(self):
+        if not self.game_over:
+            self.game_over = True
+            self._emit("game_over")
+
+    def _show_info(self, text):
+        self.info_text = text
+        self.info_time = self.time
+
+    def _raise_water(self, fallback_len):
+        percent = self.percent_start + self.percent_step * (self.round_number - 1)
+        if self.water.word_stats.count > 0:
+            avg_len = self.water.word_stats.mean
+        else:
+            avg_len = fallback_len
+        water_rise_letters = avg_len * percent
+        if water_rise_letters > 0:
+            self.water.rise(water_rise_letters * self.rise_per_letter)
+        self.round_number += 1
+
+    def submit(self):
+        submitted_word = self.input_text.strip().lower()
+        self.input_text = ""
+        self.prefix.reset()
+        if submitted_word == "":
+            return
 
-    while running:
-        dt = clock.tick(60) / 1000.0
+        if submitted_word in self.submitted_words:
+            self._show_info("Already used!")
+            self._emit("already_used")
+            self._raise_water(len(submitted_word))
+        elif submitted_word in self.current_question:
+            self._accept_word(submitted_word, len(submitted_word) * 10)
+            self._show_info("Correct!")
+        elif self.fuzzy and self._accept_fuzzy(submitted_word):
+            pass
+        else:
+            self._show_info("Wrong!")
+            self._emit("wrong")
+            if self.round_number == 1:
+                self._end_game()
+            else:
+                self._raise_water(len(submitted_word))
+
+    def _accept_word(self, word, points):
+        self.submitted_words.add(word)
+        self.tower.add_word(word)
+        self.score += points
+        self.water.word_stats.add(len(word))
+        self._raise_water(len(word))
+        self._emit("correct")
+
+    def _accept_fuzzy(self, submitted_word):
+        match = self.current_question.fuzzy_index(self.fuzzy_distance).lookup(submitted_word)
+        if match is None:
+            return False
+        word, _distance = match
+        if word in self.submitted_words:
+            self._show_info(f"Already used! ({word})")
+            self._emit("already_used")
+            self._raise_water(len(word))
+            return True
+        points = int(len(word) * 10 * (1 - self.fuzzy_penalty))
+        self._accept_word(word, points)
+        self._show_info(f"Did you mean {word}? -{int(self.fuzzy_penalty * 100)}%")
+        return True
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if self.game_over:
+            if event.key == pygame.K_r:
+                self.restart()
+        elif event.key == pygame.K_RETURN:
+            self.submit()
+        elif event.key == pygame.K_BACKSPACE:
+            if self.input_text:
+                self.input_text = self.input_text[:-1]
+                self.prefix.pop()
+        elif event.unicode and event.unicode.isprintable():
+            self.input_text += event.unicode
+            self.prefix.push(event.unicode)
+
+    @property
+    def input_status(self):
+        # empty / prefix (ยังเป็นคำตอบได้) / word (ตรงคำในหมวดพอดี) / dead (ไม่มีคำไหนขึ้นต้นแบบนี้)
+        return self.prefix.status
 
-        if info_text and (pygame.time.get_ticks() / 1000.0 - info_time) > INFO_DURATION:
-            info_text = ""
+    def update(self, dt):
+        self.prev_camera_y = self.camera_y
+        self.prev_water_level = self.water.level
+        # เช็ก enabled ครั้งเดียว simulate.py ที่รันเป็นพันเกมจะได้ไม่เสียค่า with ทุก step
+        if profiler.enabled:
+            with profiler.section("water.update"):
+                if self.owns_water:
+                    self.water.update(dt)
+            with profiler.section("camera"):
+                self._follow_tower(dt)
+        else:
+            if self.owns_water:
+                self.water.update(dt)
+            self._follow_tower(dt)
+
+        tower = self.tower
+        if len(tower) > 0 and self.water.level <= tower.top_y:
+            self._end_game()
+
+    def _follow_tower(self, dt):
+        # ให้กล้องมันตามบล็อกไปปปปปป
+        tower = self.tower
+        if len(tower) > 0:
+            tower_top_in_view = tower.top_y - self.camera_y
+            tower_bottom_in_view = tower.bottom_y - self.camera_y
+
+            if tower_top_in_view < self.view_h / 4:
+                self.camera_target_y = tower.top_y - self.view_h / 4
+            elif tower_bottom_in_view > self.view_h * 3 / 4:
+                self.camera_target_y = tower.bottom_y - self.view_h * 3 / 4
+        else:
+            self.camera_target_y = 0
+
+        self.camera_y += (self.camera_target_y - self.camera_y) * (1.0 - math.exp(-CAMERA_RATE * dt))
+
+    def interpolated(self, alpha):
+        # ตำแหน่งกล้อง/น้ำสำหรับวาด ระหว่าง step ก่อนหน้ากับ step ล่าสุด (alpha 0..1)
+        camera_y = self.prev_camera_y + (self.camera_y - self.prev_camera_y) * alpha
+        water_level = self.prev_water_level + (self.water.level - self.prev_water_level) * alpha
+        return camera_y, water_level
+
+    def step(self, dt, events=()):
+        # คืน False เมื่อมี QUIT
+        self.time += dt
+        if self.info_text and (self.time - self.info_time) > INFO_DURATION:
+            self.info_text = ""
+        if profiler.enabled and events:
+            with profiler.section("events"):
+                running = self.handle_events(events)
+        else:
+            running = self.handle_events(events)
+        self.update(dt)
+        return running
 
-        for event in pygame.event.get():
+    def handle_events(self, events):
+        running = True
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            else:
+                self.handle_event(event)
+        return running
 
-            elif event.type == pygame.KEYDOWN:
-                if not game_over:
-                    if event.key == pygame.K_RETURN:
-                        submitted_word = input_text.strip().lower()
-                        if submitted_word != "":
-
-                            if submitted_word in submitted_words:
-                                info_text = "Already used!"
-                                info_time = pygame.time.get_ticks() / 1000.0
-
-                                percent = PERCENT_START + PERCENT_STEP * (round_number - 1)
-                                
-                                if len(water.word_lengths) > 0:
-                                    avg_len = sum(water.word_lengths) / len(water.word_lengths)
-                                else:
-                                    avg_len = len(submitted_word)
-                                water_rise_letters = avg_len * percent
-                                if water_rise_letters > 0:
-                                    rise_px = water_rise_letters * WATER_RISE_PIXELS_PER_LETTER
-                                    water.rise(rise_px)
-                                round_number += 1
-
-                            else:
-                                
-                                if submitted_word in current_question:
-                                    submitted_words.add(submitted_word)
-                                    add_word_blocks(submitted_word)
-                                    score += len(submitted_word) * 10
-
-                                   
-                                    water.word_lengths.append(len(submitted_word))
-
-                                    percent = PERCENT_START + PERCENT_STEP * (round_number - 1)
-                                    avg_len = sum(water.word_lengths) / len(water.word_lengths)
-                                    water_rise_letters = avg_len * percent
-                                    if water_rise_letters > 0:
-                                        rise_px = water_rise_letters * WATER_RISE_PIXELS_PER_LETTER
-                                        water.rise(rise_px)
-
-                                    round_number += 1
-
-                                    info_text = "Correct!"
-                                    info_time = pygame.time.get_ticks() / 1000.0
-
-                                    
-                                else:
-                                    info_text = "Wrong!"
-                                    info_time = pygame.time.get_ticks() / 1000.0
-
-                                    if round_number == 1:
-                                        game_over = True
-                                    else:
-                                        percent = PERCENT_START + PERCENT_STEP * (round_number - 1)
-                                        if len(water.word_lengths) > 0:
-                                            avg_len = sum(water.word_lengths) / len(water.word_lengths)
-                                        else:
-                                            avg_len = len(submitted_word)
-                                        water_rise_letters = avg_len * percent
-                                        if water_rise_letters > 0:
-                                            rise_px = water_rise_letters * WATER_RISE_PIXELS_PER_LETTER
-                                            water.rise(rise_px)
-                                        round_number += 1
-
-                        input_text = ""
-                    elif event.key == pygame.K_BACKSPACE:
-                        input_text = input_text[:-1]
-                    else:
-                        if event.unicode and event.unicode.isprintable():
-                            input_text += event.unicode
-                else:
-                    if event.key == pygame.K_r:
-                        blocks.clear()
-                        input_text = ""
-                        chosen_category = random.choice(list(questions.keys()))
-                        current_question = questions[chosen_category]
-                        water.reset(start_level=HEIGHT - 100)
-                        round_number = 1
-                        score = 0
-                        camera_y = 0
-                        camera_target_y = 0
-                        game_over = False
-                        submitted_words.clear()
-                        info_text = ""
-                        info_time = 0.0
-
-    
-        water.update(dt)
-
-     # ให้กล้องมันตามบล็อกไปปปปปป
-        if len(blocks) > 0:
-            top_block_y = min(block.y for block in blocks)
-            bottom_block_y = max(block.y for block in blocks)
-            tower_top_in_view = top_block_y - camera_y
-            tower_bottom_in_view = bottom_block_y - camera_y
-
-            if tower_top_in_view < HEIGHT / 4:
-                camera_target_y = top_block_y - HEIGHT / 4
-            elif tower_bottom_in_view > HEIGHT * 3 / 4:
-                camera_target_y = bottom_block_y - HEIGHT * 3 / 4
-        else:
-            camera_target_y = 0
-
-        camera_y += (camera_target_y - camera_y) * 0.12
 
-        if len(blocks) > 0:
-            top_block_y = min(block.y for block in blocks)
-            if water.level <= top_block_y:
-                game_over = True
+HINT_SIZE = 18
+INPUT_STATUS_COLORS = {"prefix": GREEN, "word": GREEN, "dead": RED}
+INPUT_STATUS_HINTS = {
+    "prefix": "still a possible answer",
+    "word": "press Enter!",
+    "dead": "no word starts with this",
+}
 
 
-        if background:
-            screen.blit(background, (0, 0))
+class FixedTimestep:
+    # สะสมเวลาจริงของแต่ละเฟรมแล้วเดินเกมทีละ step เท่า ๆ กัน เฟรมช้าก็แค่เดินหลาย step
+    def __init__(self, step=FIXED_DT, max_frame=MAX_FRAME_DT):
+        self.step = step
+        self.max_frame = max_frame
+        self.accumulator = 0.0
+        self.pending = []
+
+    def advance(self, state, frame_dt, events=()):
+        self.accumulator += min(frame_dt, self.max_frame)
+        # event ที่มาในเฟรมที่ยังไม่ครบหนึ่ง step เก็บไว้ให้ step ถัดไป
+        self.pending.extend(events)
+        running = True
+        while self.accumulator >= self.step:
+            running = state.step(self.step, self.pending) and running
+            self.pending = []
+            self.accumulator -= self.step
+        return running
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step
+
+
+def draw_game(surface, state, alpha=1.0):
+    camera_y, water_level = state.interpolated(alpha)
+    with profiler.section("background"):
+        draw_background(surface, camera_y)
+
+    with profiler.section("blocks"):
+        state.tower.draw(surface, camera_y)
+    with profiler.section("water.draw"):
+        state.water.draw(surface, camera_y, water_level)
+
+    with profiler.section("hud"):
+        draw_hud(surface, state)
+
+
+def draw_hud(surface, state):
+    # แก้เติมพื้นหลังกล่องอินพุตละ 
+    input_box = pygame.Rect(20, 20, 760, 50)
+    input_bg = surface_pool.get(input_box.size, (255, 255, 255, 100))
+    surface.blit(input_bg, (input_box.x, input_box.y))
+    status = state.input_status
+    pygame.draw.rect(surface, INPUT_STATUS_COLORS.get(status, WHITE), input_box, 2)
+    hint = INPUT_STATUS_HINTS.get(status)
+    if hint:
+        hint_surf = text_cache.render(get_font(HINT_SIZE), hint, INPUT_STATUS_COLORS[status])
+        surface.blit(hint_surf, hint_surf.get_rect(midright=(input_box.right - 10, input_box.centery)))
+
+    hud_category.draw(surface, state.chosen_category)
+    hud_score.draw(surface, state.score)
+    hud_round.draw(surface, state.round_number)
+    hud_input.draw(surface, state.input_text)
+
+    if state.info_text:
+        color = YELLOW
+        if state.info_text.lower().startswith("wrong") or state.info_text.lower().startswith("already"):
+            color = RED
+        draw_text(surface, state.info_text, FONT, color, 20, 130)
+
+    if state.game_over:
+        overlay = surface_pool.get((WIDTH, HEIGHT), (0, 0, 0, 180))
+        surface.blit(overlay, (0, 0))
+        draw_text(surface, "GAME OVER!", BIG, RED, WIDTH // 2 - 140, HEIGHT // 3)
+        hud_final_score.draw(surface, state.score)
+        draw_text(surface, "Press R to Restart", FONT, LIGHT_BLUE, WIDTH // 2 - 150, HEIGHT // 2 + 50)
+
+
+class ProfilerOverlay:
+    # กล่องตัวเลขของ profiler มุมซ้ายล่าง render ข้อความใหม่แค่ทุก refresh วินาที
+    # ใช้ font.render ตรง ๆ ไม่ผ่าน text_cache ตัวเลขที่เปลี่ยนตลอดจะได้ไม่ไล่ข้อความอื่นออกจาก cache และไม่ถูกนับเป็น alloc
+    RECT = pygame.Rect(10, HEIGHT - 190, 300, 180)
+    LINE_H = 16
+
+    def __init__(self, profiler, refresh=0.5):
+        self.profiler = profiler
+        self.refresh = refresh
+        self.lines = []
+        self.next_refresh = 0
+
+    def draw(self, surface):
+        now = pygame.time.get_ticks()
+        if now >= self.next_refresh:
+            font = get_font(14)
+            self.lines = [font.render(line, True, WHITE) for line in self.profiler.overlay_lines()]
+            self.next_refresh = now + int(self.refresh * 1000)
+        rect = self.RECT
+        surface.blit(surface_pool.get(rect.size, (0, 0, 0, 170)), rect.topleft)
+        y = rect.y + 6
+        for line in self.lines:
+            if y + self.LINE_H > rect.bottom:
+                break
+            surface.blit(line, (rect.x + 8, y))
+            y += self.LINE_H
+
+
+class DirtyRectRenderer:
+    # วาดใหม่เฉพาะส่วนที่เปลี่ยนแล้ว display.update(rects) แทน flip ทั้งจอ
+    # กล้องขยับ/ตึกเปลี่ยน/เกมจบ = วาดใหม่ทั้งจอ นอกนั้นวาดแค่แถบคลื่น กล่องพิมพ์ และ HUD
+    INPUT_RECT = pygame.Rect(18, 18, 764, 54)
+    HUD_RECT = pygame.Rect(0, 72, WIDTH, 128)
+    WAVE_MARGIN = 20
+
+    def __init__(self, surface, overlay=None):
+        self.surface = surface
+        self.screen_rect = surface.get_rect()
+        self.overlay = overlay
+        self.invalidate()
+
+    def invalidate(self):
+        self.last_scene = None
+        self.last_hud = None
+        self.last_input = None
+        self.last_water_y = None
+
+    def _wave_rect(self, water_y):
+        top = min(water_y, self.last_water_y) - self.WAVE_MARGIN
+        bottom = max(water_y, self.last_water_y) + self.WAVE_MARGIN
+        return pygame.Rect(0, top, WIDTH, bottom - top).clip(self.screen_rect)
+
+    def render(self, state, alpha=1.0):
+        surface = self.surface
+        camera_y, water_level = state.interpolated(alpha)
+        water_y = int(water_level - camera_y)
+        scene = (int(camera_y), len(state.tower), state.game_over, state.chosen_category)
+        hud = (state.score, state.round_number, state.info_text)
+
+        show_overlay = self.overlay is not None and self.overlay.profiler.overlay
+
+        if scene != self.last_scene:
+            draw_game(surface, state, alpha)
+            if show_overlay:
+                self.overlay.draw(surface)
+            with profiler.section("display"):
+                pygame.display.flip()
+            rects = [self.screen_rect]
         else:
-            screen.fill(BLACK)
-
-        for block in blocks:
-            block.draw(screen, camera_y)
-        water.draw(screen, camera_y)
-
-        # แก้เติมพื้นหลังกล่องอินพุตละ 
-        input_box = pygame.Rect(20, 20, 760, 50)
-        input_bg = pygame.Surface((input_box.width, input_box.height), pygame.SRCALPHA)
-        input_bg.fill((255, 255, 255, 100))
-        screen.blit(input_bg, (input_box.x, input_box.y))
-        pygame.draw.rect(screen, WHITE, input_box, 2)
-
-        avg_display = 0.0
-        if len(water.word_lengths) > 0:
-            avg_display = sum(water.word_lengths) / len(water.word_lengths)
-
-        BOX_COLOR = (255, 255, 255, 200)
-        draw_text_box(screen, f"Category: {chosen_category}", FONT, BLACK, BOX_COLOR, 20, 80)
-        draw_text_box(screen, f"Score: {score}", FONT, GREEN, BOX_COLOR, WIDTH - 200, 100)
-        draw_text_box(screen, f"Round: {round_number}", FONT, LIGHT_BLUE, BOX_COLOR, WIDTH - 200, 150)
-        draw_text(screen, input_text, FONT, BLUE, input_box.x + 10, input_box.y + 10)
-
+            rects = []
+            if state.input_text != self.last_input:
+                rects.append(self.INPUT_RECT)
+            if hud != self.last_hud:
+                rects.append(self.HUD_RECT)
+            wave = self._wave_rect(water_y)
+            if wave.height > 0:
+                rects.append(wave)
+            if show_overlay:
+                rects.append(self.overlay.RECT)
+
+            merged = []
+            for rect in rects:
+                # กรอบกล่องพิมพ์/HUD วาดตอนมี clip ตัดกลางแล้วได้ pixel ไม่เหมือนวาดทั้งจอ (ขอบ 2px เกินมาแถว)
+                # rect ไหนโดนวิดเจ็ตพวกนี้ ขยายให้คลุมทั้งวิดเจ็ตไปเลย
+                for widget in (self.INPUT_RECT, self.HUD_RECT):
+                    if rect.colliderect(widget):
+                        rect = rect.union(widget)
+                for i, other in enumerate(merged):
+                    if rect.colliderect(other):
+                        merged[i] = other.union(rect)
+                        break
+                else:
+                    merged.append(rect)
+            rects = merged
+
+            for rect in rects:
+                surface.set_clip(rect)
+                draw_game(surface, state, alpha)
+            surface.set_clip(None)
+            if show_overlay:
+                self.overlay.draw(surface)
+            if rects:
+                with profiler.section("display"):
+                    pygame.display.update(rects)
+
+        self.last_scene = scene
+        self.last_hud = hud
+        self.last_input = state.input_text
+        self.last_water_y = water_y
+        return rects
+
+
+def draw_loading(surface):
+    surface.fill(BLACK)
+    draw_text(surface, "Text or Die", BIG, WHITE, WIDTH // 2 - 130, HEIGHT // 3)
+    draw_text(surface, "Loading words...", FONT, LIGHT_BLUE, WIDTH // 2 - 95, HEIGHT // 2)
+    pygame.display.flip()
+
+
+def wait_for_words(surface, loader):
+    # ระหว่างรอโหลดคำศัพท์ก็วาดหน้าโหลดไปก่อน คืน False ถ้าผู้เล่นปิดหน้าต่าง
+    while not loader.done():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+        draw_loading(surface)
+        clock.tick(60)
+    return True
 
-        if info_text:
-            color = YELLOW
-            if info_text.lower().startswith("wrong") or info_text.lower().startswith("already"):
-                color = RED
-            draw_text(screen, info_text, FONT, color, 20, 130)
 
-        if game_over:
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            screen.blit(overlay, (0, 0))
-            draw_text(screen, "GAME OVER!", BIG, RED, WIDTH // 2 - 140, HEIGHT // 3)
-            draw_text(screen, f"Final Score: {score}", FONT, WHITE, WIDTH // 2 - 120, HEIGHT // 2)
-            draw_text(screen, "Press R to Restart", FONT, LIGHT_BLUE, WIDTH // 2 - 150, HEIGHT // 2 + 50)
+def restart_pressed(events):
+    return any(event.type == pygame.KEYDOWN and event.key == pygame.K_r for event in events)
 
-        pygame.display.flip()
 
+def main():
+    # สุ่มหมวดก่อน แล้วโหลดเฉพาะหมวดนั้นใน thread ระหว่างวาดหน้าโหลด
+    questions = get_questions()
+    seed = random.randrange(1 << 32)
+    rng, category = new_game_rng(questions, seed)
+    fuzzy_distance = FUZZY_MAX_DISTANCE if FUZZY_MATCHING else None
+    loader = questions.preload([category], fuzzy_distance)
+    screen = init()
+    if not wait_for_words(screen, loader):
+        pygame.quit()
+        return
+    state = GameState(questions, rng=rng, category=category)
+    recorder = None
+    if RECORD_REPLAYS:
+        if __package__:
+            from .replay import ReplayRecorder
+        else:
+            from replay import ReplayRecorder
+        recorder = state = ReplayRecorder(state, seed, FIXED_DT)
+    renderer = DirtyRectRenderer(screen, ProfilerOverlay(profiler))
+    timestep = FixedTimestep()
+    next_loader = None
+    running = True
 
+    while running:
+        profiler.begin_frame()
+        dt = clock.tick(RENDER_FPS) / 1000.0
+        # พอจบเกมก็เริ่มโหลดหมวดที่กด R แล้วจะได้ไว้ใน thread เลย ไม่ให้ไปโหลด/สร้าง fuzzy index บน thread ที่วาดจอ
+        if not state.game_over:
+            next_loader = None
+        elif next_loader is None:
+            next_loader = questions.preload([state.next_category()], fuzzy_distance)
+        events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == PROFILER_KEY:
+                profiler.toggle_overlay()
+                renderer.invalidate()
+        if next_loader is not None and not next_loader.done() and restart_pressed(events):
+            # กด R ก่อนโหลดเสร็จ รอที่หน้าโหลดแทนที่จอจะค้าง
+            if not wait_for_words(screen, next_loader):
+                break
+            renderer.invalidate()
+        running = timestep.advance(state, dt, events)
+        for name in state.pop_events():
+            audio.play(name)
+        renderer.render(state, timestep.alpha)
+        audio.start()
 
     pygame.quit()
+    if recorder is not None:
+        name = time.strftime("%Y%m%d-%H%M%S") + f"-{seed}.todr"
+        try:
+            print("replay saved to", recorder.save(os.path.join(REPLAY_DIR, name)))
+        except OSError as e:
+            print("Warning: could not save replay:", e)
+    if PROFILE_OUT:
+        profiler.export(PROFILE_OUT)
+        print("profile written to", PROFILE_OUT)
 
 
-try:
-    background = pygame.image.load("Bg1.png").convert()
-
-    background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-except Exception as e:
-    print("Warning: background 1.png not found or failed to load:", e)
-    background = None
-
 if __name__ == "__main__":
     main()
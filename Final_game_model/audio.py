@@ -0,0 +1,96 @@
+import math
+import os
+import threading
+from array import array
+
+import pygame
+
+# เสียงเอฟเฟกต์: ชื่อ -> (ไฟล์, ความถี่ของเสียงบี๊บสำรองถ้าไม่มีไฟล์)
+SFX = {
+    "correct": ("sfx_correct.wav", 880),
+    "wrong": ("sfx_wrong.wav", 220),
+    "already_used": ("sfx_already_used.wav", 440),
+    "game_over": ("sfx_game_over.wav", 110),
+}
+
+
+def _tone(freq, duration=0.15, volume=0.3):
+    # สร้างเสียงบี๊บสั้น ๆ เป็น buffer เลย ไม่ต้องมีไฟล์
+    rate, fmt, channels = pygame.mixer.get_init()
+    if abs(fmt) != 16:
+        return None
+    n = int(rate * duration)
+    samples = array("h")
+    for i in range(n):
+        v = int(volume * 32767 * math.sin(2 * math.pi * freq * i / rate) * (1 - i / n))
+        samples.extend([v] * channels)
+    return pygame.mixer.Sound(buffer=samples.tobytes())
+
+
+class NullAudio:
+    # ใช้ตอนรันแบบ headless หรือเปิด mixer ไม่ได้ ทุกอย่างไม่ทำอะไร
+    def start(self):
+        pass
+
+    def play(self, name):
+        pass
+
+    def stop(self):
+        pass
+
+
+class AudioManager:
+    # เพลงยาวใช้ mixer.music (stream จากไฟล์ ไม่ decode ทั้งไฟล์ลงเมม)
+    # เอฟเฟกต์สั้น ๆ decode เป็น Sound ไว้ก่อน ทั้งหมดทำใน thread หลังเฟรมแรก จะได้ไม่ค้างตอนเปิดเกม
+    def __init__(self, asset_dir, music_file="music.mp3", sfx=SFX):
+        self.asset_dir = asset_dir
+        self.music_file = music_file
+        self.sfx = sfx
+        self.sounds = {}
+        self.thread = None
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.thread = threading.Thread(target=self._load, name="audio-loader", daemon=True)
+        self.thread.start()
+
+    def _load(self):
+        try:
+            pygame.mixer.music.load(os.path.join(self.asset_dir, self.music_file))
+            pygame.mixer.music.play(-1, 0.0)
+        except pygame.error as e:
+            print(f"Warning: {self.music_file} failed to load:", e)
+
+        for name, (filename, freq) in self.sfx.items():
+            path = os.path.join(self.asset_dir, filename)
+            try:
+                if os.path.exists(path):
+                    sound = pygame.mixer.Sound(path)
+                else:
+                    sound = _tone(freq)
+            except pygame.error as e:
+                print(f"Warning: sound {filename} failed to load:", e)
+                sound = None
+            if sound is not None:
+                self.sounds[name] = sound
+
+    def play(self, name):
+        # ยังโหลดไม่เสร็จก็ข้ามไป ไม่รอ
+        sound = self.sounds.get(name)
+        if sound is not None:
+            sound.play()
+
+    def stop(self):
+        pygame.mixer.music.stop()
+
+
+def create_audio(asset_dir, enabled=True):
+    if not enabled:
+        return NullAudio()
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print("Warning: audio disabled:", e)
+        return NullAudio()
+    return AudioManager(asset_dir)
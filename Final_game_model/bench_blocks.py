@@ -0,0 +1,100 @@
+# วัดเวลาวาดตึกต่อเฟรมเทียบกับความสูงของตึก + เมม/เวลาสร้างตึกแบบ array เทียบกับ object ต่อตัวอักษร
+# รันจากโฟลเดอร์ Final_game_model:  python bench_blocks.py
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import Game_model as gm
+
+HEIGHTS = [10, 50, 200, 1000]
+FRAMES = 60
+MEMORY_LETTERS = [10_000, 1_000_000]
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+class LegacyBlock:
+    # บล็อกแบบเดิม: object มี __dict__ ต่อตัวอักษร เก็บ x/กว้าง/สูงซ้ำทุกก้อน
+    def __init__(self, x, y, letter, color=gm.GREY):
+        self.x = x
+        self.y = y
+        self.letter = letter.upper()
+        self.width = gm.block_width
+        self.height = gm.block_height
+        self.color = color
+        self.sprite = None
+
+
+def draw_block_uncached(screen, x, y, letter, color):
+    # แบบเดิม: render ตัวอักษรใหม่ทุกบล็อกทุกเฟรม
+    rect = pygame.Rect(x, y, gm.block_width, gm.block_height)
+    pygame.draw.rect(screen, color, rect)
+    pygame.draw.rect(screen, (100, 100, 100), rect, 2)
+    text = gm.FONT.render(letter, True, gm.BLACK)
+    screen.blit(text, text.get_rect(center=rect.center))
+
+
+def make_word(n):
+    return (LETTERS * (n // len(LETTERS) + 1))[:n]
+
+
+def make_tower(n):
+    tower = gm.Tower()
+    tower.add_word(make_word(n))
+    return tower
+
+
+def make_legacy_blocks(n):
+    base_top_y = gm.HEIGHT - 130 - gm.block_height
+    x = gm.WIDTH // 2 - gm.block_width // 2
+    return [LegacyBlock(x, base_top_y - i * gm.block_height, ch) for i, ch in enumerate(make_word(n))]
+
+
+def frame_ms(draw):
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw()
+    return (time.perf_counter() - start) * 1000.0 / FRAMES
+
+
+def uncached_frame(tower):
+    screen = gm.screen
+    for i in range(len(tower)):
+        draw_block_uncached(screen, tower.x, tower.ys[i], tower.letter_at(i), gm.GREY)
+
+
+def measure_build(build, n):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(n)
+    elapsed = time.perf_counter() - start
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size, elapsed
+
+
+def main():
+    gm.init(audio_enabled=False)
+    print(f"{'blocks':>8} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for n in HEIGHTS:
+        tower = make_tower(n)
+        before = frame_ms(lambda: uncached_frame(tower))
+        after = frame_ms(lambda: tower.draw(gm.screen, 0))
+        print(f"{n:>8} {before:>10.3f} {after:>10.3f} {before / after:>7.2f}x")
+
+    print()
+    print(f"{'letters':>9} {'objects MB':>11} {'arrays MB':>10} {'objects ms':>11} {'arrays ms':>10}")
+    for n in MEMORY_LETTERS:
+        legacy_bytes, legacy_s = measure_build(make_legacy_blocks, n)
+        tower_bytes, tower_s = measure_build(make_tower, n)
+        print(f"{n:>9} {legacy_bytes / 1e6:>11.2f} {tower_bytes / 1e6:>10.2f} "
+              f"{legacy_s * 1000:>11.1f} {tower_s * 1000:>10.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# เปิด server บน localhost แล้วปล่อย bot หลายสิบตัวต่อเข้าไปส่งคำ วัด latency ของ tick และจำนวนข้อความต่อวินาที
+# รันจากโฟลเดอร์ Final_game_model:  python bench_netgame.py --clients 10 25 50 --seconds 5
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import Game_model as gm
+from netgame import GameServer, encode
+from profiler import percentile
+
+
+class BotStats:
+    def __init__(self):
+        self.latencies_ms = []
+        self.messages = 0
+        self.bytes = 0
+
+
+async def bot(port, name, words, stats, stop, rng, think_time, accuracy):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(encode({"t": "join", "n": name}))
+    await reader.readline()  # welcome
+
+    async def listen():
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            received = time.perf_counter()
+            msg = json.loads(line)
+            stats.messages += 1
+            stats.bytes += len(line)
+            if msg.get("t") == "d":
+                # server อยู่ process เดียวกัน perf_counter เลยเทียบกันได้ตรง ๆ
+                stats.latencies_ms.append((received - msg["ts"]) * 1000.0)
+
+    listener = asyncio.create_task(listen())
+    try:
+        while not stop.is_set():
+            await asyncio.sleep(think_time * (0.5 + rng.random()))
+            word = rng.choice(words) if rng.random() < accuracy else "zzz" + rng.choice(words)
+            writer.write(encode({"t": "word", "w": word}))
+            writer.write(encode({"t": "restart"}))  # server ไม่สนถ้ายังไม่จบเกม
+    finally:
+        listener.cancel()
+        writer.close()
+
+
+async def run(n_clients, seconds, tick_rate, think_time, accuracy, seed):
+    questions = gm.get_questions()
+    rng = random.Random(seed)
+    category = questions.names()[0]
+    server = await GameServer(questions, category=category, rng=random.Random(seed), port=0,
+                              tick_rate=tick_rate).start()
+    words = questions[category].words
+    stats = BotStats()
+    stop = asyncio.Event()
+    bots = [asyncio.create_task(bot(server.port, f"bot{i}", words, stats, stop, random.Random(rng.random()),
+                                    think_time, accuracy))
+            for i in range(n_clients)]
+    await asyncio.sleep(0.5)  # ให้ทุกตัวต่อเสร็จก่อนเริ่มนับ
+    stats.latencies_ms.clear()
+    stats.messages = stats.bytes = 0
+    server.tick_ms.clear()
+    sent_before = server.messages_sent
+    ticks_before = server.tick
+    start = time.perf_counter()
+    await asyncio.sleep(seconds)
+    elapsed = time.perf_counter() - start
+    # เก็บตัวเลขก่อนสั่งหยุด ช่วงที่ bot กำลังปิดตัวไม่นับ
+    sent = server.messages_sent - sent_before
+    ticks = server.tick - ticks_before
+    tick_ms = list(server.tick_ms)
+    latencies = list(stats.latencies_ms)
+    received, received_bytes = stats.messages, stats.bytes
+    stop.set()
+    await asyncio.gather(*bots, return_exceptions=True)
+    await server.close()
+    return {
+        "clients": n_clients,
+        "ticks/s": ticks / elapsed,
+        "tick p50": percentile(tick_ms, 50),
+        "tick p99": percentile(tick_ms, 99),
+        "lat p50": percentile(latencies, 50),
+        "lat p99": percentile(latencies, 99),
+        "sent/s": sent / elapsed,
+        "recv/s": received / elapsed,
+        "bytes/msg": received_bytes / received if received else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Localhost load test for netgame.py")
+    parser.add_argument("--clients", type=int, nargs="+", default=[10, 25, 50])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--tick-rate", type=int, default=30)
+    parser.add_argument("--think-time", type=float, default=1.0)
+    parser.add_argument("--accuracy", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    columns = ["clients", "ticks/s", "tick p50", "tick p99", "lat p50", "lat p99", "sent/s", "recv/s", "bytes/msg"]
+    print(" ".join(f"{c:>9}" for c in columns), "  (tick/lat in ms)")
+    for n in args.clients:
+        result = asyncio.run(run(n, args.seconds, args.tick_rate, args.think_time, args.accuracy, args.seed))
+        print(" ".join(f"{result[c]:>9.0f}" if c in ("clients", "sent/s", "recv/s") else f"{result[c]:>9.2f}"
+                       for c in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# วัดเวลาต่อเฟรมของโหมด split screen ตามจำนวนผู้เล่น (ผู้เล่นสมมติส่งคำเรื่อย ๆ)
+# รันจากโฟลเดอร์ Final_game_model:  python bench_splitscreen.py [--shared-water]
+# ผลที่วัดได้ (SDL dummy driver, 3 รอบ): 1 คน ~0.7 ms, 2 คน ~1.0 ms, 4 คน ~1.7-2.0 ms, 8 คน ~1.5-1.9 ms
+# โตจาก 2 ไป 4 คนเกือบสองเท่า ไม่ได้คงที่ ตัวที่โตคือ blit พื้นหลังของแต่ละช่อง (logic ต่อคนแค่ ~0.01 ms)
+# ช่องกว้าง 200px ที่ x = 200/600 SDL copy ช้ากว่าต่อ pixel ~5 เท่า ทั้งที่พื้นที่รวมเท่าเดิม
+# จาก 4 ไป 8 คน (สองแถว ช่องกว้างเท่าเดิม) ถึงจะคงที่
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import Game_model as gm
+from simulate import typed_events
+from splitscreen import Race
+
+PLAYER_COUNTS = [1, 2, 4, 8]
+FRAMES = 300
+SUBMIT_EVERY = 45  # เฟรม
+
+
+def run(n_players, shared_water, seed=0):
+    questions = gm.get_questions()
+    rng = random.Random(seed)
+    race = Race(questions, n_players, gm.screen.get_size(), rng=rng,
+                category=questions.names()[0], shared_water=shared_water)
+    words = race.players[0].state.current_question.words
+    step_s = draw_s = 0.0
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        # ผู้เล่นสมมติส่งคำคนละจังหวะ ส่ง event ให้ GameState ของตัวเองตรง ๆ ไม่ต้องผ่าน focus
+        for i, player in enumerate(race.players):
+            if (frame + i * 7) % SUBMIT_EVERY == 0 and not player.state.game_over:
+                player.state.handle_events(typed_events(rng.choice(words)))
+        race.step(gm.FIXED_DT)
+        race.pop_events()
+        mid = time.perf_counter()
+        race.draw(gm.screen)
+        pygame.display.flip()
+        end = time.perf_counter()
+        step_s += mid - start
+        draw_s += end - mid
+    alive = sum(not p.state.game_over for p in race.players)
+    return step_s * 1000.0 / FRAMES, draw_s * 1000.0 / FRAMES, alive
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split-screen frame time vs player count")
+    parser.add_argument("--shared-water", action="store_true")
+    args = parser.parse_args()
+
+    gm.init(audio_enabled=False)
+    print(f"{'players':>8} {'step ms':>8} {'draw ms':>8} {'frame ms':>9} {'alive':>6}")
+    for n in PLAYER_COUNTS:
+        step_ms, draw_ms, alive = run(n, args.shared_water)
+        print(f"{n:>8} {step_ms:>8.3f} {draw_ms:>8.3f} {step_ms + draw_ms:>9.3f} {alive:>6}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
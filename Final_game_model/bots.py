@@ -0,0 +1,100 @@
+# คู่แข่ง AI: พิมพ์ทีละตัวด้วยความเร็วที่ตั้งไว้ พิมพ์ผิดได้ และเลือกคำยาวเพื่อให้ตึกโตหนีน้ำ
+# bot ส่ง event KEYDOWN แบบเดียวกับคนกด เลยใช้กับ GameState, Race (splitscreen.py) และ simulate.py ได้เหมือนกัน
+# เลือกคำจาก WordDictionary.by_length() (สร้างครั้งเดียวต่อหมวด) แล้วสุ่มแบบ "ได้คำที่ใช้แล้วก็สุ่มใหม่"
+# เทียบกับ state.submitted_words แต่ละครั้งเฉลี่ย O(1) ไม่ต้องไล่ทั้ง list หรือ copy หมวดให้ bot ทุกตัว
+import random
+import string
+
+import pygame
+
+PICK_TRIES = 8  # สุ่มได้คำที่ใช้แล้วเกินนี้ ถือว่ากลุ่มนั้นหมดแล้ว ไปกลุ่มถัดไป
+
+
+class BotSkill:
+    def __init__(self, chars_per_sec=5.0, error_rate=0.1, long_bias=0.5, think_time=1.5):
+        self.chars_per_sec = chars_per_sec
+        self.error_rate = error_rate  # โอกาสพิมพ์ผิดหนึ่งตัวในคำ
+        self.long_bias = long_bias  # โอกาสเลือกคำที่ยาวที่สุดที่ยังไม่ใช้ แทนที่จะสุ่มทั้งหมวด
+        self.think_time = think_time  # เวลานึกคำเฉลี่ย (วินาที) ก่อนเริ่มพิมพ์
+
+
+SKILLS = {
+    "easy": BotSkill(chars_per_sec=3.0, error_rate=0.25, long_bias=0.1, think_time=2.5),
+    "normal": BotSkill(chars_per_sec=5.0, error_rate=0.1, long_bias=0.5, think_time=1.5),
+    "hard": BotSkill(chars_per_sec=9.0, error_rate=0.03, long_bias=0.9, think_time=0.6),
+}
+
+
+def key_event(ch):
+    if ch == "\r":
+        return pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode="\r")
+    return pygame.event.Event(pygame.KEYDOWN, key=0, unicode=ch)
+
+
+def choose_word(dictionary, used, rng, long_bias=0.0):
+    if rng.random() < long_bias:
+        for _length, bucket in dictionary.by_length():
+            for _ in range(PICK_TRIES):
+                word = rng.choice(bucket)
+                if word not in used:
+                    return word
+    words = dictionary.words
+    if not words:
+        return None
+    for _ in range(PICK_TRIES):
+        word = rng.choice(words)
+        if word not in used:
+            return word
+    # หมวดเกือบหมดแล้ว ส่งคำซ้ำไปโดนลงโทษเหมือนคนจริง
+    return word
+
+
+def make_typo(word, rng):
+    i = rng.randrange(len(word))
+    wrong = rng.choice(string.ascii_lowercase.replace(word[i], ""))
+    return word[:i] + wrong + word[i + 1:]
+
+
+class Bot:
+    def __init__(self, skill=SKILLS["normal"], rng=None):
+        self.skill = skill
+        self.rng = rng if rng is not None else random.Random()
+        self.keys = []  # ตัวที่ยังต้องพิมพ์ (ตัวสุดท้ายคือ Enter)
+        self.wait = self._think()
+        self.words_sent = 0
+
+    def _think(self):
+        return self.skill.think_time * (0.5 + self.rng.random())
+
+    def reset(self):
+        self.keys = []
+        self.wait = self._think()
+
+    def decide(self, state):
+        word = choose_word(state.current_question, state.submitted_words, self.rng, self.skill.long_bias)
+        if word is None:
+            return []
+        if self.rng.random() < self.skill.error_rate:
+            word = make_typo(word, self.rng)
+        self.words_sent += 1
+        return list(word) + ["\r"]
+
+    def update(self, dt, state):
+        # คืน event ที่ bot "กด" ในช่วง dt นี้
+        if state.game_over:
+            return []
+        events = []
+        self.wait -= dt
+        while self.wait <= 0:
+            if not self.keys:
+                self.keys = self.decide(state)
+                if not self.keys:
+                    self.wait = self._think()
+                    break
+            ch = self.keys.pop(0)
+            events.append(key_event(ch))
+            if ch == "\r":
+                self.wait += self._think()
+            else:
+                self.wait += 1.0 / self.skill.chars_per_sec
+        return events
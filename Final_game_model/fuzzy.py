@@ -0,0 +1,100 @@
+# หาคำที่สะกดใกล้เคียง (พิมพ์ผิดไม่เกิน k ตัว) แบบ SymSpell:
+# ตอนสร้าง index เก็บทุกแบบที่ได้จากการลบตัวอักษรออก <= k ตัว (เฉพาะ prefix_length ตัวแรก)
+# ตอนค้นก็ลบตัวอักษรจากคำที่พิมพ์แบบเดียวกัน แล้วเปิด dict เอาคำที่ชนกันมาเช็กระยะจริงอีกที
+# ไม่ต้องไล่ทุกคำในหมวด ค้นได้ในระดับไมโครวินาทีแม้หมวดจะมีเป็นแสนคำ
+
+# ยอมผิดได้ 1 ตัวต่อทุก ๆ CHARS_PER_EDIT ตัวของคำในหมวด คำที่สั้นกว่านี้ต้องพิมพ์ถูกเป๊ะ
+# ไม่งั้นคำสั้น ๆ มั่ว ๆ อย่าง "ab" ก็ห่างจาก "ant" แค่ 2 ตัว นับเป็นคำตอบได้
+CHARS_PER_EDIT = 4
+
+
+def allowed_distance(word, max_distance, chars_per_edit=CHARS_PER_EDIT):
+    if not chars_per_edit:
+        return max_distance
+    return min(max_distance, len(word) // chars_per_edit)
+
+
+def _deletes(word, max_distance):
+    result = {word}
+    frontier = [word]
+    for _ in range(max_distance):
+        next_frontier = []
+        for w in frontier:
+            for i in range(len(w)):
+                d = w[:i] + w[i + 1:]
+                if d not in result:
+                    result.add(d)
+                    next_frontier.append(d)
+        frontier = next_frontier
+    return result
+
+
+def edit_distance(a, b, max_distance):
+    # Damerau (optimal string alignment) ที่หยุดเมื่อเกิน max_distance แล้ว คืน max_distance + 1
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    prev_prev = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            v = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                v = min(v, prev_prev[j - 2] + 1)
+            cur[j] = v
+            if v < row_min:
+                row_min = v
+        if row_min > max_distance:
+            return max_distance + 1
+        prev_prev, prev = prev, cur
+    return prev[-1]
+
+
+class FuzzyIndex:
+    def __init__(self, words, max_distance=2, prefix_length=7):
+        self.words = words  # tuple ที่เรียงแล้วจาก WordDictionary
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.deletes = {}
+        for idx, word in enumerate(words):
+            for d in _deletes(word[:prefix_length], max_distance):
+                bucket = self.deletes.get(d)
+                if bucket is None:
+                    self.deletes[d] = idx
+                elif isinstance(bucket, int):
+                    self.deletes[d] = [bucket, idx]
+                else:
+                    bucket.append(idx)
+
+    def lookup(self, text, max_distance=None, chars_per_edit=CHARS_PER_EDIT):
+        # คืน (คำที่ใกล้ที่สุด, ระยะ) หรือ None ถ้าไม่มีคำไหนห่างไม่เกิน max_distance
+        # ระยะที่ยอมได้ขึ้นกับความยาวของคำในหมวดที่เจอ (allowed_distance) ไม่ใช่คำที่พิมพ์
+        # "pinaple" (7 ตัว) จะได้ไปถึง "pineapple" (9 ตัว ผิดได้ 2) ส่วน "ab" ไปไม่ถึง "ant" (3 ตัว ต้องตรงเป๊ะ)
+        # chars_per_edit=None = ไม่สนความยาว
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+        if max_distance <= 0:
+            return None
+        best = None
+        best_distance = max_distance + 1
+        seen = set()
+        for d in _deletes(text[:self.prefix_length], max_distance):
+            bucket = self.deletes.get(d)
+            if bucket is None:
+                continue
+            for idx in ((bucket,) if isinstance(bucket, int) else bucket):
+                if idx in seen:
+                    continue
+                seen.add(idx)
+                word = self.words[idx]
+                dist = edit_distance(text, word, min(best_distance, max_distance))
+                if dist > max_distance or dist > allowed_distance(word, max_distance, chars_per_edit):
+                    continue
+                if dist < best_distance or (dist == best_distance and word < best):
+                    best = word
+                    best_distance = dist
+        if best is None:
+            return None
+        return best, best_distance
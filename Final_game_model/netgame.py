@@ -0,0 +1,455 @@
+# เล่นผ่านเน็ต: server (asyncio) ถือ GameState ของทุกคนเป็นตัวจริง ตรวจคำ/น้ำ/ตึก/รอบเองทั้งหมด
+# client ส่งแค่คำที่กด Enter ส่วน server ส่ง delta ของสิ่งที่เปลี่ยนในแต่ละ tick กลับไปให้ทุกคน
+# ข้อความเป็น JSON บรรทัดละหนึ่งข้อความ (TCP) คีย์สั้น ๆ และส่งเฉพาะฟิลด์ที่เปลี่ยน:
+#   client -> server  {"t":"join","n":ชื่อ}  {"t":"word","w":คำ}  {"t":"restart"}
+#   server -> client  {"t":"welcome","id":..,"cat":หมวด,"k":tick,"p":[ทุกคนแบบเต็ม]}
+#                     {"t":"d","k":tick,"ts":เวลาเริ่ม tick,"p":[{"id":..,ฟิลด์ที่เปลี่ยน}],"l":[id ที่ออก]}
+#   ฟิลด์ผู้เล่น: n ชื่อ, s คะแนน, r รอบ, w ระดับน้ำ, o จบเกม, a ตัวอักษรที่เพิ่มบนตึก, x ตึกถูกล้าง, i ข้อความ, e เสียง
+#   python netgame.py serve --port 5555
+#   python netgame.py join --host 127.0.0.1 --port 5555 --name Mint
+import argparse
+import asyncio
+import json
+import queue
+import random
+import threading
+import time
+from collections import deque
+
+import pygame
+import Game_model as gm
+
+DEFAULT_PORT = 5555
+TICK_RATE = 30
+MAX_WORD_LEN = 64
+MAX_WRITE_BUFFER = 1 << 20  # client ที่รับไม่ทันจนค้างเกินนี้ ตัดทิ้ง จะได้ไม่ถ่วงทุกคน
+
+
+def encode(msg):
+    return json.dumps(msg, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class ServerPlayer:
+    def __init__(self, pid, name, state, writer):
+        self.pid = pid
+        self.name = name
+        self.state = state
+        self.writer = writer
+        self.sent = (None,) * 5  # ค่าที่ส่งไปล่าสุด (s, r, w, o, i) ยังไม่เคยส่ง = None
+        self.sent_letters = 0
+        self.reset_pending = False
+
+    @property
+    def announced(self):
+        return self.sent[0] is not None
+
+    def snapshot(self):
+        state = self.state
+        return (state.score, state.round_number, int(state.water.level), state.game_over, state.info_text)
+
+    def restart(self, category):
+        self.state.restart(category)
+        self.reset_pending = True
+
+    def full(self):
+        # สิ่งที่ client อื่นรู้อยู่แล้ว (ค่าที่ส่งไปล่าสุด) คนที่เพิ่งเข้ามาจะได้ต่อ delta ถัดไปได้พอดี
+        s, r, w, o, i = self.sent
+        return {"id": self.pid, "n": self.name, "s": s, "r": r, "w": w, "o": int(o), "i": i,
+                "a": "".join(map(chr, self.state.tower.letters[:self.sent_letters]))}
+
+    def delta(self):
+        # คืน dict เฉพาะฟิลด์ที่เปลี่ยนจากที่ส่งไปล่าสุด หรือ None ถ้าไม่มีอะไรเปลี่ยน
+        out = {}
+        if not self.announced:
+            out["n"] = self.name
+        current = self.snapshot()
+        if current != self.sent:
+            for key, old, new in zip("srwoi", self.sent, current):
+                if old != new:
+                    out[key] = int(new) if key == "o" else new
+            self.sent = current
+        letters = self.state.tower.letters
+        if self.reset_pending:
+            out["x"] = 1
+            self.sent_letters = 0
+            self.reset_pending = False
+        if len(letters) > self.sent_letters:
+            out["a"] = "".join(map(chr, letters[self.sent_letters:]))
+            self.sent_letters = len(letters)
+        events = self.state.pop_events()
+        if events:
+            out["e"] = events
+        if not out:
+            return None
+        out["id"] = self.pid
+        return out
+
+
+class GameServer:
+    # ทุกคนเล่นหมวดเดียวกัน น้ำของใครของมัน เดินเกมทีละ tick ด้วย dt คงที่เหมือน FixedTimestep
+    def __init__(self, questions, category=None, rng=None, host="127.0.0.1", port=DEFAULT_PORT,
+                 tick_rate=TICK_RATE):
+        self.questions = questions
+        self.rng = rng if rng is not None else random.Random()
+        self.category = category if category is not None else self.rng.choice(list(questions.keys()))
+        self.host = host
+        self.port = port
+        self.dt = 1.0 / tick_rate
+        self.players = {}
+        self.left = []
+        self.next_id = 1
+        self.tick = 0
+        self.tick_ms = deque(maxlen=2000)
+        self.messages_sent = 0
+        self.server = None
+        self.ticker = None
+        self.handlers = set()
+
+    async def start(self):
+        # โหลดหมวด (พร้อม trie) ให้เสร็จก่อนเปิดรับคน ไม่งั้นคนแรกที่ join จะโหลดบน event loop
+        # ทำให้ tick ของทุกคนค้างไปด้วย โหลดใน thread ของ WordListLoader แล้วรอแบบไม่บล็อก loop
+        await asyncio.to_thread(self.questions.preload([self.category]).wait)
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.ticker = asyncio.create_task(self._tick_loop())
+        return self
+
+    async def close(self):
+        if self.ticker is not None:
+            self.ticker.cancel()
+        if self.server is not None:
+            self.server.close()
+        for player in list(self.players.values()):
+            player.writer.close()
+        # รอ handler ของทุก client จบเอง (เจอ EOF) ไม่งั้นตอนปิด loop มันจะถูก cancel กลางทาง
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+
+    def _send(self, player, data):
+        writer = player.writer
+        if writer.is_closing():
+            return
+        if writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            writer.close()
+            return
+        writer.write(data)
+        self.messages_sent += 1
+
+    async def _handle(self, reader, writer):
+        task = asyncio.current_task()
+        self.handlers.add(task)
+        player = None
+        try:
+            hello = json.loads(await reader.readline() or b"{}")
+            if not isinstance(hello, dict) or hello.get("t") != "join":
+                return
+            pid = self.next_id
+            self.next_id += 1
+            state = gm.GameState(self.questions, rng=random.Random(self.rng.random()), category=self.category)
+            name = str(hello.get("n") or f"P{pid}")[:16]
+            player = ServerPlayer(pid, name, state, writer)
+            # คนอื่น (และตัวเอง) จะเห็นคนใหม่ใน delta ของ tick ถัดไป ยังไม่เคยส่งเลยได้ครบทุกฟิลด์
+            welcome = {"t": "welcome", "id": pid, "cat": self.category, "k": self.tick,
+                       "p": [p.full() for p in self.players.values() if p.announced]}
+            self.players[pid] = player
+            self._send(player, encode(welcome))
+
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    msg = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(msg, dict):
+                    # JSON ถูกแต่ไม่ใช่ object เช่น [1,2] หรือ "hi" ข้ามไปเหมือนบรรทัดเสีย
+                    continue
+                kind = msg.get("t")
+                if kind == "word":
+                    self.submit(player, str(msg.get("w", ""))[:MAX_WORD_LEN])
+                elif kind == "restart" and player.state.game_over:
+                    player.restart(self.category)
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            if player is not None:
+                self.players.pop(player.pid, None)
+                self.left.append(player.pid)
+            writer.close()
+            self.handlers.discard(task)
+
+    def submit(self, player, word):
+        state = player.state
+        if state.game_over:
+            return
+        state.input_text = word
+        state.submit()
+
+    def step(self):
+        started = time.perf_counter()
+        self.tick += 1
+        deltas = []
+        for player in self.players.values():
+            player.state.step(self.dt)
+            d = player.delta()
+            if d is not None:
+                deltas.append(d)
+        msg = {"t": "d", "k": self.tick, "ts": started}
+        if deltas:
+            msg["p"] = deltas
+        if self.left:
+            msg["l"] = self.left
+            self.left = []
+        # encode ครั้งเดียวส่งเหมือนกันทุกคน ค่าต่อ tick ไม่โตตามจำนวนคนคูณจำนวนคน
+        data = encode(msg)
+        for player in list(self.players.values()):
+            self._send(player, data)
+        self.tick_ms.append((time.perf_counter() - started) * 1000.0)
+
+    async def _tick_loop(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            self.step()
+            next_tick += self.dt
+            delay = next_tick - loop.time()
+            if delay < -self.dt:
+                # ช้าไปเกินหนึ่ง tick ไม่ต้องวิ่งไล่ทัน เริ่มนับใหม่
+                next_tick = loop.time()
+                delay = 0
+            await asyncio.sleep(max(0.0, delay))
+
+
+class NetClient:
+    # เชื่อม server ใน thread แยก (มี event loop ของตัวเอง) ลูปของ pygame เรียก poll()/send() ได้โดยไม่ต้องรอเน็ต
+    def __init__(self, host, port, name):
+        self.host = host
+        self.port = port
+        self.name = name
+        self.inbox = queue.SimpleQueue()
+        self.loop = None
+        self.writer = None
+        self.error = None
+        self.thread = threading.Thread(target=self._thread_main, name="net-client", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _thread_main(self):
+        try:
+            asyncio.run(self._run())
+        except (OSError, ConnectionError) as e:
+            self.error = e
+        finally:
+            self.inbox.put({"t": "closed"})
+
+    async def _run(self):
+        reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.loop = asyncio.get_running_loop()
+        self.writer.write(encode({"t": "join", "n": self.name}))
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            self.inbox.put(json.loads(line))
+
+    def send(self, msg):
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.writer.write, encode(msg))
+
+    def wait_welcome(self, timeout=5.0):
+        # welcome มาเป็นข้อความแรกเสมอ อ่านแค่ตัวนั้น delta ที่ตามมายังอยู่ใน inbox ให้ poll() ต่อ
+        try:
+            msg = self.inbox.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        return msg if msg.get("t") == "welcome" else None
+
+    def poll(self):
+        messages = []
+        while True:
+            try:
+                messages.append(self.inbox.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def close(self):
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.writer.close)
+
+
+class RemoteGame:
+    # สำเนาฝั่ง client: GameState ของเราไว้พิมพ์/ดูคำขึ้นต้น/วาด ส่วนค่าจริงทับด้วย delta จาก server
+
+    def __init__(self, questions, welcome, client):
+        self.client = client
+        self.pid = welcome["id"]
+        self.category = welcome["cat"]
+        self.state = gm.GameState(questions, category=self.category)
+        self.others = {}  # id -> {"n", "s", "h", "o"}
+        for p in welcome["p"]:
+            self._apply_other(p)
+        self.tick = welcome["k"]
+
+    def _apply_other(self, p):
+        other = self.others.setdefault(p["id"], {"n": f"P{p['id']}", "s": 0, "h": 0, "o": 0})
+        for key in ("n", "s", "o"):
+            if key in p:
+                other[key] = p[key]
+        if p.get("x"):
+            other["h"] = 0
+        other["h"] += len(p.get("a", ""))
+
+    def _apply_self(self, p):
+        state = self.state
+        if p.get("x"):
+            state.tower.clear()
+            state.submitted_words.clear()
+        if "a" in p:
+            state.tower.add_word(p["a"])
+        if "s" in p:
+            state.score = p["s"]
+        if "r" in p:
+            state.round_number = p["r"]
+        if "w" in p:
+            state.water.level = float(p["w"])
+        if "o" in p:
+            state.game_over = bool(p["o"])
+        if "i" in p:
+            state._show_info(p["i"])
+        return p.get("e", ())
+
+    def apply(self, msg):
+        # คืนชื่อเสียงที่ต้องเล่นของเรา
+        sounds = []
+        if msg.get("t") != "d":
+            return sounds
+        self.tick = msg["k"]
+        for p in msg.get("p", ()):
+            if p["id"] == self.pid:
+                sounds.extend(self._apply_self(p))
+            else:
+                self._apply_other(p)
+        for pid in msg.get("l", ()):
+            self.others.pop(pid, None)
+        return sounds
+
+    def handle_event(self, event, client):
+        # Enter ส่งคำไปให้ server ตัดสิน ไม่ตรวจเอง ที่เหลือ (พิมพ์/ลบ) ใช้ของ GameState ตามปกติ
+        state = self.state
+        if event.type != pygame.KEYDOWN:
+            return
+        if state.game_over:
+            if event.key == pygame.K_r:
+                client.send({"t": "restart"})
+        elif event.key == pygame.K_RETURN:
+            word = state.input_text.strip().lower()
+            state.input_text = ""
+            state.prefix.reset()
+            if word:
+                client.send({"t": "word", "w": word})
+        else:
+            state.handle_event(event)
+
+    def step(self, dt, events=()):
+        # หน้าตาเหมือน GameState.step ใช้กับ FixedTimestep ได้เลย
+        running = True
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+            else:
+                self.handle_event(event, self.client)
+        # ใช้ update ของ GameState แค่ให้กล้องตามตึก ไม่ให้ตัดสินจบเกมเอง รอค่าจาก server
+        game_over = self.state.game_over
+        self.state.time += dt
+        if self.state.info_text and (self.state.time - self.state.info_time) > gm.INFO_DURATION:
+            self.state.info_text = ""
+        self.state.update(dt)
+        self.state.game_over = game_over
+        self.state.events.clear()
+        return running
+
+
+def draw_scoreboard(surface, game):
+    font = gm.get_font(gm.HINT_SIZE)
+    y = gm.HEIGHT - 24
+    for other in sorted(game.others.values(), key=lambda o: -o["s"])[:8]:
+        text = f"{other['n']}: {other['s']} ({other['h']} blocks){' OUT' if other['o'] else ''}"
+        gm.draw_text(surface, text, font, gm.WHITE, 20, y)
+        y -= 20
+
+
+def play(host, port, name):
+    client = NetClient(host, port, name).start()
+    welcome = client.wait_welcome()
+    if welcome is None:
+        print("could not join:", client.error or "no welcome from server")
+        client.close()
+        return
+
+    questions = gm.get_questions()
+    loader = questions.preload([welcome["cat"]])
+    screen = gm.init()
+    pygame.display.set_caption(f"Text or Die - online ({name})")
+    if not gm.wait_for_words(screen, loader):
+        client.close()
+        pygame.quit()
+        return
+
+    game = RemoteGame(questions, welcome, client)
+    timestep = gm.FixedTimestep()
+    running = True
+    while running:
+        dt = gm.clock.tick(gm.RENDER_FPS) / 1000.0
+        for msg in client.poll():
+            if msg.get("t") == "closed":
+                running = False
+            for sound in game.apply(msg):
+                gm.audio.play(sound)
+        running = timestep.advance(game, dt, pygame.event.get()) and running
+        gm.draw_game(screen, game.state, timestep.alpha)
+        draw_scoreboard(screen, game)
+        pygame.display.flip()
+        gm.audio.start()
+
+    client.close()
+    pygame.quit()
+
+
+async def serve(host, port, tick_rate):
+    questions = gm.get_questions()
+    server = await GameServer(questions, host=host, port=port, tick_rate=tick_rate).start()
+    print(f"serving '{server.category}' on {host}:{server.port} at {tick_rate} ticks/s")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Text or Die network play")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve_p = sub.add_parser("serve")
+    serve_p.add_argument("--host", default="0.0.0.0")
+    serve_p.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve_p.add_argument("--tick-rate", type=int, default=TICK_RATE)
+    join_p = sub.add_parser("join")
+    join_p.add_argument("--host", default="127.0.0.1")
+    join_p.add_argument("--port", type=int, default=DEFAULT_PORT)
+    join_p.add_argument("--name", default="player")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        try:
+            asyncio.run(serve(args.host, args.port, args.tick_rate))
+        except KeyboardInterrupt:
+            pass
+    else:
+        play(args.host, args.port, args.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import csv
+import json
+import time
+from collections import deque
+
+
+class _NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        frame = self.profiler.current
+        frame[self.name] = frame.get(self.name, 0.0) + (time.perf_counter() - self.start) * 1000.0
+        return False
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p / 100.0 * len(ordered)))]
+
+
+class FrameProfiler:
+    # จับเวลาแต่ละส่วนของเฟรม (ms) เก็บย้อนหลัง history เฟรม ปิดอยู่ section() แทบไม่มีค่าใช้จ่าย
+    # alloc_counter = ฟังก์ชันคืนจำนวน surface ที่สร้างไปแล้วทั้งหมด เอาไว้ดูว่าเฟรมไหนยัง allocate อยู่
+    def __init__(self, enabled=False, history=600, alloc_counter=None):
+        self.enabled = enabled
+        self.overlay = False
+        self.enabled_before_overlay = enabled
+        self.alloc_counter = alloc_counter
+        self.frames = deque(maxlen=history)
+        self.sections = {}
+        self.current = {}
+        self.frame_start = None
+        self.last_allocs = 0
+
+    def section(self, name):
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = _Section(self, name)
+        return section
+
+    def toggle_overlay(self):
+        # เปิด overlay ต้องจับเวลาด้วย ปิด overlay ก็กลับไปเป็นเหมือนก่อนกด (TOD_PROFILE=1 ก็ยังจับเวลาต่อ)
+        self.overlay = not self.overlay
+        if self.overlay:
+            self.enabled_before_overlay = self.enabled
+            self.enabled = True
+        elif not self.enabled_before_overlay:
+            self.enabled = False
+            # เฟรมที่จับค้างไว้ทิ้งไป เปิดใหม่จะได้ไม่นับช่วงที่ปิดอยู่เป็นเฟรมยาวเฟรมเดียว
+            self.frame_start = None
+            self.current = {}
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.frame_start is not None and self.current:
+            frame = self.current
+            frame["frame"] = (now - self.frame_start) * 1000.0
+            frame["work"] = sum(v for k, v in frame.items() if k not in ("frame", "allocs"))
+            if self.alloc_counter is not None:
+                allocs = self.alloc_counter()
+                frame["allocs"] = allocs - self.last_allocs
+                self.last_allocs = allocs
+            self.frames.append(frame)
+        elif self.alloc_counter is not None:
+            self.last_allocs = self.alloc_counter()
+        self.frame_start = now
+        self.current = {}
+
+    def summary(self):
+        frames = list(self.frames)
+        if not frames:
+            return {}
+        names = sorted({k for f in frames for k in f if k not in ("frame", "work", "allocs")})
+        wall = [f["frame"] for f in frames]
+        work = [f["work"] for f in frames]
+        return {
+            "frames": len(frames),
+            "fps": 1000.0 * len(wall) / sum(wall) if sum(wall) else 0.0,
+            "work_p50_ms": percentile(work, 50),
+            "work_p99_ms": percentile(work, 99),
+            "allocs_per_frame": sum(f.get("allocs", 0) for f in frames) / len(frames),
+            "sections_ms": {n: sum(f.get(n, 0.0) for f in frames) / len(frames) for n in names},
+        }
+
+    def overlay_lines(self):
+        s = self.summary()
+        if not s:
+            return ["profiling..."]
+        lines = [
+            f"FPS {s['fps']:.0f}  p50 {s['work_p50_ms']:.2f}ms  p99 {s['work_p99_ms']:.2f}ms",
+            f"surface allocs/frame {s['allocs_per_frame']:.2f}",
+        ]
+        for name, ms in s["sections_ms"].items():
+            lines.append(f"{name:<13} {ms:6.3f}ms")
+        return lines
+
+    def export(self, path):
+        # .json = summary + ทุกเฟรม, อย่างอื่น = csv หนึ่งแถวต่อเฟรม
+        frames = list(self.frames)
+        if path.endswith(".json"):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"summary": self.summary(), "frames": frames}, f, indent=1)
+            return
+        columns = sorted({k for frame in frames for k in frame})
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, restval=0)
+            writer.writeheader()
+            writer.writerows(frames)
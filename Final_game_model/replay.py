@@ -0,0 +1,273 @@
+# บันทึก/เล่นซ้ำเกมจาก input อย่างเดียว (ไม่ต้องอัดวิดีโอ) ใช้หาบั๊กหรือเช็กข้อโต้แย้งจากเครื่องหน้าร้าน
+# เกมเดินทีละ fixed step และสุ่มจาก rng ที่ seed ไว้ เก็บแค่ seed + ว่ากดปุ่มไหนที่ step ที่เท่าไหร่ ก็ได้เกมเดิมทุกอย่าง
+# ไฟล์: b"TODR" + version + flags แล้วตามด้วยเนื้อ (zlib ถ้า flags มี FLAG_ZLIB) ตัวเลขทั้งหมดเป็น varint:
+#   seed, step ต่อวินาที, fuzzy, ความยาว+ชื่อหมวด(utf-8), ความยาว+ลายนิ้วมือกติกา (rules_fingerprint, ตั้งแต่ version 2)
+#   แต่ละ event: step ที่ห่างจาก event ก่อน, key + 1, ตัวอักษร (code point + 1, 0 = ไม่มี)
+#   จบด้วย step ที่ห่าง, 0  (ตอนเซฟ = จำนวน step ทั้งหมดที่เดินไป)
+#   python replay.py replays/xxxx.todr              เล่นซ้ำเร็วสุดไม่วาดจอ แล้วพิมพ์ผลท้ายเกม
+#   python replay.py replays/xxxx.todr --realtime   เล่นซ้ำตามเวลาจริงพร้อมวาดจอ
+#   python replay.py replays/xxxx.todr --force      เล่นต่อแม้คำศัพท์/ค่าสมดุลเกมไม่ตรงกับตอนอัด
+import argparse
+import hashlib
+import os
+import sys
+import time
+import zlib
+
+import pygame
+
+if __package__:
+    from .fuzzy import CHARS_PER_EDIT
+else:
+    from fuzzy import CHARS_PER_EDIT
+
+# ไม่ import Game_model ตรงนี้ เพราะ Game_model.main() import ไฟล์นี้ ตอนรัน Game_model.py เป็นสคริปต์
+# จะได้ไม่โหลด Game_model ซ้ำเป็นโมดูลที่สอง ฟังก์ชันที่ต้องใช้ค่อย import ข้างใน
+
+MAGIC = b"TODR"
+VERSION = 2
+FLAG_ZLIB = 1
+
+
+class ReplayMismatch(ValueError):
+    pass
+
+
+def rules_fingerprint(state):
+    # hash ของทุกอย่างที่ต้องเหมือนเดิมถึงจะเล่นซ้ำได้ตรง แต่ไม่ได้อยู่ใน input:
+    # คำในหมวดที่เล่น, รายชื่อหมวด (rng สุ่มหมวดตอนกด R จากรายชื่อนี้) และค่าสมดุลเกม/fuzzy
+    # เครื่องหน้าร้านที่แก้ words/*.txt หรือค่าคงที่แล้ว replay จะไม่เพี้ยนเงียบ ๆ
+    h = hashlib.blake2b(digest_size=8)
+    h.update("\n".join(state.current_question.words).encode("utf-8"))
+    h.update(b"\0")
+    h.update("\n".join(state.questions.keys()).encode("utf-8"))
+    rules = (state.percent_start, state.percent_step, state.rise_per_letter, state.view_h,
+             state.water.anim_dur, state.fuzzy_distance, state.fuzzy_penalty, CHARS_PER_EDIT)
+    h.update(repr(rules).encode("ascii"))
+    return h.digest()
+
+
+def write_varint(out, n):
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def read_varint(data, pos):
+    result = shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
+
+
+class ReplayRecorder:
+    # ครอบ GameState ไว้ หน้าตาเหมือน GameState.step ใช้กับ FixedTimestep ได้เลย
+    # บันทึกทุก KEYDOWN พร้อมเลข step ที่มันเข้าเกม (ไม่ใช่เวลาจริง) เล่นซ้ำเลยตรงทุก step
+    def __init__(self, state, seed, dt):
+        self.state = state
+        self.seed = seed
+        self.dt = dt
+        self.steps = 0
+        self.last_step = 0
+        self.body = bytearray()
+        self.finished = False
+        write_varint(self.body, seed)
+        # เก็บเป็นจำนวน step ต่อวินาที แล้วตอนเล่นคิด 1.0 / rate ใหม่ จะได้ dt ตัวเดียวกับ FIXED_DT เป๊ะ
+        write_varint(self.body, round(1.0 / dt))
+        write_varint(self.body, int(state.fuzzy))
+        name = state.chosen_category.encode("utf-8")
+        write_varint(self.body, len(name))
+        self.body += name
+        fingerprint = rules_fingerprint(state)
+        write_varint(self.body, len(fingerprint))
+        self.body += fingerprint
+
+    def _record(self, key, char):
+        if self.finished:
+            return
+        write_varint(self.body, self.steps - self.last_step)
+        self.last_step = self.steps
+        write_varint(self.body, key)
+        write_varint(self.body, char)
+
+    def step(self, dt, events=()):
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                self._record(event.key + 1, ord(event.unicode) + 1 if len(event.unicode) == 1 else 0)
+        running = self.state.step(dt, events)
+        self.steps += 1
+        return running
+
+    def finish(self):
+        # ปิดท้ายด้วยจำนวน step ที่เดินไปแล้วทั้งหมด (รวม step ที่ FixedTimestep เดินต่อหลัง QUIT ในเฟรมเดียวกัน)
+        # เรียกตอนเซฟ หลังจากนี้ step ต่อก็ไม่บันทึกแล้ว
+        if not self.finished:
+            self.finished = True
+            write_varint(self.body, self.steps - self.last_step)
+            self.body.append(0)
+
+    def __getattr__(self, name):
+        # อย่างอื่น (interpolated, pop_events, ...) ส่งต่อให้ GameState
+        return getattr(self.state, name)
+
+    def to_bytes(self, compress=True):
+        self.finish()
+        body = bytes(self.body)
+        flags = 0
+        if compress:
+            body = zlib.compress(body, 9)
+            flags |= FLAG_ZLIB
+        return MAGIC + bytes([VERSION, flags]) + body
+
+    def save(self, path, compress=True):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.to_bytes(compress))
+        os.replace(tmp_path, path)
+        return path
+
+
+class Replay:
+    def __init__(self, seed, dt, fuzzy, category, events, total_steps, fingerprint=None):
+        self.seed = seed
+        self.dt = dt
+        self.fuzzy = fuzzy
+        self.category = category
+        self.events = events  # [(step, key, unicode), ...]
+        self.total_steps = total_steps
+        self.fingerprint = fingerprint  # None = ไฟล์ version 1 ไม่ได้เก็บไว้
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] != MAGIC:
+            raise ValueError("not a Text or Die replay")
+        version, flags = data[4], data[5]
+        if version not in (1, VERSION):
+            raise ValueError(f"unsupported replay version {version}")
+        body = data[6:]
+        if flags & FLAG_ZLIB:
+            body = zlib.decompress(body)
+        seed, pos = read_varint(body, 0)
+        rate, pos = read_varint(body, pos)
+        fuzzy, pos = read_varint(body, pos)
+        name_len, pos = read_varint(body, pos)
+        category = body[pos:pos + name_len].decode("utf-8")
+        pos += name_len
+        fingerprint = None
+        if version >= 2:
+            fp_len, pos = read_varint(body, pos)
+            fingerprint = bytes(body[pos:pos + fp_len])
+            pos += fp_len
+        events = []
+        step = 0
+        while True:
+            delta, pos = read_varint(body, pos)
+            step += delta
+            key, pos = read_varint(body, pos)
+            if key == 0:
+                break
+            char, pos = read_varint(body, pos)
+            events.append((step, key - 1, chr(char - 1) if char else ""))
+        return cls(seed, 1.0 / rate, bool(fuzzy), category, events, step, fingerprint)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def new_state(self, questions, strict=True):
+        # strict: คำศัพท์/ค่าสมดุลไม่ตรงกับตอนอัด = ReplayMismatch (เล่นไปก็ไม่ใช่เกมเดิม) ไม่ strict แค่เตือนแล้วเล่นต่อ
+        import Game_model as gm
+        if self.category not in questions:
+            raise ReplayMismatch(f"category '{self.category}' is not in this build's word lists")
+        rng, category = gm.new_game_rng(questions, self.seed)
+        if category != self.category:
+            print(f"Warning: seed picks '{category}' but the replay was recorded on '{self.category}',"
+                  " word files probably changed")
+        state = gm.GameState(questions, rng=rng, category=self.category, fuzzy=self.fuzzy)
+        if self.fingerprint is None:
+            print("Warning: old replay without a rules fingerprint, cannot check word lists or balance")
+        elif self.fingerprint != rules_fingerprint(state):
+            message = "word lists or game balance differ from the ones this replay was recorded with"
+            if strict:
+                raise ReplayMismatch(message)
+            print("Warning:", message)
+        return state
+
+    def steps(self):
+        # ทีละ step: (dt, events ของ step นั้น)
+        events = self.events
+        i = 0
+        for step in range(self.total_steps):
+            batch = []
+            while i < len(events) and events[i][0] == step:
+                _, key, char = events[i]
+                batch.append(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char, mod=0))
+                i += 1
+            yield self.dt, batch
+
+
+def play_headless(replay, questions, strict=True):
+    state = replay.new_state(questions, strict)
+    for dt, events in replay.steps():
+        state.step(dt, events)
+    state.pop_events()
+    return state
+
+
+def play_realtime(replay, questions, strict=True):
+    import Game_model as gm
+    state = replay.new_state(questions, strict)
+    screen = gm.init()
+    pygame.display.set_caption("Text or Die - replay")
+    renderer = gm.DirtyRectRenderer(screen)
+    for dt, events in replay.steps():
+        if any(e.type == pygame.QUIT for e in pygame.event.get()):
+            break
+        state.step(dt, events)
+        for name in state.pop_events():
+            gm.audio.play(name)
+        renderer.render(state)
+        gm.audio.start()
+        gm.clock.tick(round(1.0 / replay.dt))
+    pygame.quit()
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play back a Text or Die replay")
+    parser.add_argument("path")
+    parser.add_argument("--realtime", action="store_true", help="play at recorded speed with rendering")
+    parser.add_argument("--force", action="store_true",
+                        help="play even if word lists or balance differ from the recording (result will diverge)")
+    args = parser.parse_args()
+
+    import Game_model as gm
+    replay = Replay.load(args.path)
+    questions = gm.get_questions()
+    print(f"seed {replay.seed}, '{replay.category}', {len(replay.events)} key presses, "
+          f"{replay.total_steps} steps ({replay.total_steps * replay.dt:.1f}s)")
+    start = time.perf_counter()
+    try:
+        if args.realtime:
+            state = play_realtime(replay, questions, not args.force)
+        else:
+            state = play_headless(replay, questions, not args.force)
+    except ReplayMismatch as e:
+        sys.exit(f"Cannot replay: {e} (use --force to play anyway)")
+    elapsed = time.perf_counter() - start
+    print(f"final score {state.score}, round {state.round_number}, tower {len(state.tower)} blocks, "
+          f"game over: {state.game_over}")
+    print(f"replayed in {elapsed:.3f}s ({replay.total_steps / max(elapsed, 1e-9):.0f} steps/s)")
+
+
+if __name__ == "__main__":
+    main()
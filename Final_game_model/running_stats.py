@@ -0,0 +1,40 @@
+from collections import deque
+
+
+class RunningStats:
+    # เก็บแค่ count/sum (และผลรวมของ window ล่าสุด) หาค่าเฉลี่ยได้ O(1) ไม่ต้อง sum() ทั้ง list
+    __slots__ = ("count", "total", "window", "_recent", "_recent_total")
+
+    def __init__(self, window=None):
+        self.window = window
+        self.reset()
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if self.window:
+            if len(self._recent) == self.window:
+                self._recent_total -= self._recent[0]
+            self._recent.append(value)
+            self._recent_total += value
+
+    @property
+    def mean(self):
+        if self.count == 0:
+            return 0.0
+        return self.total / self.count
+
+    @property
+    def window_mean(self):
+        if not self._recent:
+            return self.mean
+        return self._recent_total / len(self._recent)
+
+    def reset(self):
+        self.count = 0
+        self.total = 0
+        self._recent = deque(maxlen=self.window) if self.window else deque()
+        self._recent_total = 0
+
+    def __len__(self):
+        return self.count
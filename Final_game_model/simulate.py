@@ -0,0 +1,116 @@
+# จำลองเกมแบบ headless ไม่มีจอ ไม่มีเสียง ไม่จำกัด FPS เอาไว้จูนค่าน้ำขึ้น
+# ไม่เรียก gm.init() เลย จึงไม่มี pygame surface ถูกสร้าง
+#   python simulate.py --games 2000 --percent-start 0.5 --percent-step 0.1
+#   python simulate.py --games 20 --bots 200 --bot-skill hard   (ให้ bot หลายตัวเล่นพร้อมกันเกมละ 200 ตัว)
+import argparse
+import random
+import time
+
+import pygame
+import Game_model as gm
+from bots import SKILLS, Bot
+
+
+def typed_events(text):
+    events = [pygame.event.Event(pygame.KEYDOWN, key=0, unicode=ch) for ch in text]
+    events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode="\r"))
+    return events
+
+
+def play_game(state, rng, accuracy=0.8, think_time=2.0, dt=0.1, max_rounds=500):
+    # ผู้เล่นสมมติ: ตอบถูกตามความแม่น ส่งคำทุก think_time วินาที
+    words = state.current_question.words
+    while not state.game_over and state.round_number <= max_rounds:
+        if rng.random() < accuracy:
+            word = rng.choice(words)
+        else:
+            word = "zzz" + rng.choice(words)
+        state.step(dt, typed_events(word))
+        waited = dt
+        while waited < think_time and not state.game_over:
+            state.step(dt)
+            waited += dt
+    return state.round_number, state.score
+
+
+def play_bots(states, bots, dt=0.1, max_time=600.0):
+    # bot ทุกตัวเล่นพร้อมกันคนละ GameState จนจมหมด (หรือครบ max_time วินาทีในเกม)
+    alive = list(zip(states, bots))
+    t = 0.0
+    while alive and t < max_time:
+        for state, bot in alive:
+            state.step(dt, bot.update(dt, state))
+        alive = [(state, bot) for state, bot in alive if not state.game_over]
+        t += dt
+    return [(state.round_number, state.score) for state in states]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Text or Die balance runs")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--accuracy", type=float, default=0.8)
+    parser.add_argument("--percent-start", type=float, default=gm.PERCENT_START)
+    parser.add_argument("--percent-step", type=float, default=gm.PERCENT_STEP)
+    parser.add_argument("--rise-per-letter", type=float, default=gm.WATER_RISE_PIXELS_PER_LETTER)
+    parser.add_argument("--bots", type=int, default=0)
+    parser.add_argument("--bot-skill", choices=sorted(SKILLS), default="normal")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if args.bots:
+        run_bots(args, rng)
+        return
+    state = gm.GameState(
+        gm.get_questions(),
+        rng=random.Random(args.seed),
+        percent_start=args.percent_start,
+        percent_step=args.percent_step,
+        rise_per_letter=args.rise_per_letter,
+    )
+
+    rounds_total = 0
+    score_total = 0
+    start = time.perf_counter()
+    for _ in range(args.games):
+        state.restart()
+        rounds, score = play_game(state, rng, accuracy=args.accuracy)
+        state.pop_events()
+        rounds_total += rounds
+        score_total += score
+    elapsed = time.perf_counter() - start
+
+    print(f"games: {args.games}  ({args.games / elapsed:.0f} games/s)")
+    print(f"avg rounds: {rounds_total / args.games:.2f}")
+    print(f"avg score: {score_total / args.games:.1f}")
+
+
+def run_bots(args, rng):
+    questions = gm.get_questions()
+    states = [gm.GameState(questions, rng=random.Random(rng.random()), percent_start=args.percent_start,
+                           percent_step=args.percent_step, rise_per_letter=args.rise_per_letter)
+              for _ in range(args.bots)]
+    skill = SKILLS[args.bot_skill]
+    results = []
+    decisions = 0
+    start = time.perf_counter()
+    for _ in range(args.games):
+        # ทุกตัวในเกมเดียวกันได้หมวดเดียวกัน
+        category = rng.choice(questions.names())
+        bots = [Bot(skill, random.Random(rng.random())) for _ in states]
+        for state in states:
+            state.restart(category)
+        results.extend(play_bots(states, bots))
+        for state in states:
+            state.pop_events()
+        decisions += sum(bot.words_sent for bot in bots)
+    elapsed = time.perf_counter() - start
+
+    n = len(results)
+    print(f"bot games: {n}  ({n / elapsed:.0f} bot games/s, {decisions / elapsed:.0f} words/s)")
+    print(f"avg rounds: {sum(r for r, _ in results) / n:.2f}")
+    print(f"avg score: {sum(s for _, s in results) / n:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+# โหมดแข่งหลายคนจอเดียว (split screen) ทุกคนได้หมวดเดียวกัน ใครจมน้ำก่อนออก คนสุดท้ายที่เหลือ/คะแนนสูงสุดชนะ
+# แต่ละคนคือ GameState หนึ่งตัวที่วาดลงช่องของตัวเอง (subsurface) ทุกอย่างวาดแค่ในช่อง
+# ช่องแคบลงเมื่อคนเยอะขึ้น จุดคลื่น/พื้นหลัง/บล็อกที่ต้องวาดเลยลดตาม เวลาวาดรวมเกือบคงที่
+# คนจริงผลัดกันพิมพ์ (hot-seat) ไม่ได้พิมพ์พร้อมกัน: คีย์บอร์ดมีอันเดียว (SDL แยกคีย์บอร์ดหลายอันไม่ได้)
+# และแบ่งคีย์บอร์ดเป็นโซนให้แต่ละคนก็ไม่ได้ เพราะทุกคนต้องใช้ครบทุกตัวอักษร
+# กด Tab / Shift+Tab ส่งคีย์บอร์ดให้คนถัดไป ระหว่างนั้นน้ำของทุกคนยังขึ้นต่อ
+# อยากแข่งพร้อมกันจริง ๆ ใส่ bot (bots.py พิมพ์เอง Tab ข้ามไป) หรือเล่นผ่านเน็ตด้วย netgame.py
+#   python splitscreen.py --players 4 --shared-water
+#   python splitscreen.py --players 1 --bots 3 --bot-skill hard
+import argparse
+import math
+import random
+
+import pygame
+import Game_model as gm
+from bots import SKILLS, Bot
+
+LANE_FONT_SIZE = 20
+MAX_COLUMNS = 4
+OUT_OVERLAY = (0, 0, 0, 150)
+LANE_BORDER = (40, 40, 60)
+
+
+def lane_rects(n_players, width=gm.WIDTH, height=gm.HEIGHT):
+    # ไม่เกิน MAX_COLUMNS คนต่อแถว เกินก็ขึ้นแถวใหม่ ทุกช่องขนาดเท่ากัน (น้ำร่วมกันได้)
+    # คืนช่องทั้งหมดในตาราง n_players ช่องแรกเป็นของผู้เล่น ที่เหลือเป็นช่องว่าง
+    cols = min(n_players, MAX_COLUMNS)
+    rows = math.ceil(n_players / cols)
+    w, h = width // cols, height // rows
+    return [pygame.Rect((i % cols) * w, (i // cols) * h, w, h) for i in range(rows * cols)]
+
+
+class RacePlayer:
+    def __init__(self, name, lane, state, bot=None):
+        self.name = name
+        self.lane = lane
+        self.state = state
+        self.bot = bot
+        box_x = 12
+        self.hud_input = gm.HudText("{}", LANE_FONT_SIZE, gm.BLUE, box_x, 14)
+        self.hud_score = gm.HudText(name + ": {}", LANE_FONT_SIZE, gm.BLACK, box_x, 54, gm.HUD_BOX_COLOR)
+
+
+class Race:
+    def __init__(self, questions, n_players, size=(gm.WIDTH, gm.HEIGHT), rng=None, category=None,
+                 shared_water=False, names=None, bots=None):
+        self.questions = questions
+        self.rng = rng if rng is not None else random.Random()
+        if category is None:
+            category = self.rng.choice(list(questions.keys()))
+        if n_players < 1:
+            raise ValueError("a race needs at least one player")
+        cells = lane_rects(n_players, *size)
+        self.lanes = cells[:n_players]
+        self.spare = cells[n_players:]
+        lane = self.lanes[0]
+        # น้ำร่วม: ใครตอบถูกน้ำก็ขึ้นสำหรับทุกคน ช่องกว้างเท่ากันเลยใช้ Water ตัวเดียววาดทุกช่องได้
+        self.water = None
+        if shared_water:
+            self.water = gm.Water(screen_h=lane.h, start_level=lane.h - 100, anim_dur=0.9, width=lane.w)
+        names = names or [f"P{i + 1}" for i in range(n_players)]
+        bots = bots or {}  # index ช่อง -> Bot
+        self.players = []
+        for i, (name, rect) in enumerate(zip(names, self.lanes)):
+            state = gm.GameState(questions, rng=random.Random(self.rng.random()), view_h=rect.h,
+                                 view_w=rect.w, category=category, water=self.water)
+            self.players.append(RacePlayer(name, rect, state, bots.get(i)))
+        self.humans = [i for i, p in enumerate(self.players) if p.bot is None] or [0]
+        self.focus = self.humans[0]
+        self.target = None
+        self.subsurfaces = []
+
+    def next_category(self):
+        # หมวดที่ restart() ครั้งหน้าจะสุ่มได้ (สุ่มจากสำเนา rng ไม่ขยับตัวจริง) main เอาไปโหลดรอใน thread
+        peek = random.Random()
+        peek.setstate(self.rng.getstate())
+        return peek.choice(list(self.questions.keys()))
+
+    def restart(self):
+        category = self.rng.choice(list(self.questions.keys()))
+        if self.water is not None:
+            self.water.reset(start_level=self.lanes[0].h - 100)
+        for player in self.players:
+            player.state.restart(category)
+            if player.bot is not None:
+                player.bot.reset()
+        self.focus = self.humans[0]
+
+    @property
+    def over(self):
+        return all(player.state.game_over for player in self.players)
+
+    @property
+    def winner(self):
+        # คนที่ยังไม่จมชนะเลย ถ้าจมหมดแล้วดูคะแนน
+        alive = [p for p in self.players if not p.state.game_over]
+        if len(alive) == 1 and len(self.players) > 1:
+            return alive[0]
+        if self.over:
+            return max(self.players, key=lambda p: p.state.score)
+        return None
+
+    def handle_event(self, event, routed):
+        # คืน False เมื่อมี QUIT event อื่นใส่ลง routed[index ผู้เล่น]
+        if event.type == pygame.QUIT:
+            return False
+        if event.type != pygame.KEYDOWN:
+            return True
+        if event.key == pygame.K_TAB:
+            step = -1 if event.mod & pygame.KMOD_SHIFT else 1
+            pos = self.humans.index(self.focus) if self.focus in self.humans else 0
+            self.focus = self.humans[(pos + step) % len(self.humans)]
+        elif self.over:
+            if event.key == pygame.K_r:
+                self.restart()
+        elif not self.players[self.focus].state.game_over:
+            # คนที่จมแล้วรอจนจบทั้งเกม ไม่ให้กด R เริ่มใหม่คนเดียว
+            routed[self.focus].append(event)
+        return True
+
+    def step(self, dt, events=()):
+        # หน้าตาเหมือน GameState.step ใช้กับ FixedTimestep ได้เลย
+        running = True
+        routed = [[] for _ in self.players]
+        for event in events:
+            running = self.handle_event(event, routed) and running
+        for player, player_events in zip(self.players, routed):
+            if player.bot is not None:
+                player_events = player.bot.update(dt, player.state)
+            player.state.step(dt, player_events)
+        if self.water is not None:
+            # update หลังทุกคน step แล้ว prev_water_level ของแต่ละคนจะเป็นค่าต้น step พอดี
+            self.water.update(dt)
+        return running
+
+    def pop_events(self):
+        events = []
+        for player in self.players:
+            events.extend(player.state.pop_events())
+        return events
+
+    def _lane_surfaces(self, surface):
+        # subsurface ใช้ pixel ร่วมกับจอ สร้างครั้งเดียวต่อจอ วาดลงไปได้เลยไม่ต้อง blit ต่อ
+        if self.target is not surface:
+            self.target = surface
+            self.subsurfaces = [surface.subsurface(rect) for rect in self.lanes]
+        return self.subsurfaces
+
+    def draw(self, surface, alpha=1.0):
+        for i, (player, lane_surface) in enumerate(zip(self.players, self._lane_surfaces(surface))):
+            draw_lane(lane_surface, player, i == self.focus, alpha)
+        for rect in self.spare:
+            surface.fill(gm.BLACK, rect)
+        for rect in self.lanes:
+            pygame.draw.rect(surface, LANE_BORDER, rect, 1)
+
+        winner = self.winner
+        if winner is not None and self.over:
+            font = gm.get_font(gm.FONT_SIZE)
+            text = gm.text_cache.render(font, f"{winner.name} wins! Press R to restart", gm.YELLOW)
+            gm.blit_text_box(surface, text, gm.BLACK, surface.get_width() // 2 - text.get_width() // 2,
+                             surface.get_height() // 2 - text.get_height() // 2)
+
+
+def draw_lane(surface, player, focused, alpha=1.0):
+    state = player.state
+    camera_y, water_level = state.interpolated(alpha)
+    gm.draw_background(surface, camera_y)
+    state.tower.draw(surface, camera_y)
+    state.water.draw(surface, camera_y, water_level)
+
+    w, h = surface.get_size()
+    input_box = pygame.Rect(6, 6, w - 12, 36)
+    surface.blit(gm.surface_pool.get(input_box.size, (255, 255, 255, 100)), input_box.topleft)
+    status = state.input_status
+    border = 3 if focused else 1
+    pygame.draw.rect(surface, gm.INPUT_STATUS_COLORS.get(status, gm.WHITE), input_box, border)
+    player.hud_input.draw(surface, state.input_text)
+    player.hud_score.draw(surface, state.score)
+
+    if state.info_text:
+        color = gm.RED if state.info_text.lower().startswith(("wrong", "already")) else gm.YELLOW
+        gm.draw_text(surface, state.info_text, gm.get_font(LANE_FONT_SIZE), color, 12, 90)
+
+    if state.game_over:
+        surface.blit(gm.surface_pool.get((w, h), OUT_OVERLAY), (0, 0))
+        out = gm.text_cache.render(gm.get_font(gm.BIG_SIZE), "OUT", gm.RED)
+        surface.blit(out, out.get_rect(center=(w // 2, h // 2)))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Text or Die split-screen race. Human players share one keyboard and take turns "
+                    "(Tab / Shift+Tab passes it on); bots type on their own.")
+    parser.add_argument("--players", type=int, default=2, help="human players, taking turns on the keyboard")
+    parser.add_argument("--shared-water", action="store_true")
+    parser.add_argument("--bots", type=int, default=0)
+    parser.add_argument("--bot-skill", choices=sorted(SKILLS), default="normal")
+    args = parser.parse_args()
+    if args.players < 0 or args.bots < 0 or args.players + args.bots < 1:
+        parser.error("need at least one player or bot")
+
+    questions = gm.get_questions()
+    rng = random.Random()
+    category = rng.choice(questions.names())
+    loader = questions.preload([category])
+    screen = gm.init()
+    if not gm.wait_for_words(screen, loader):
+        pygame.quit()
+        return
+
+    n = args.players + args.bots
+    names = [f"P{i + 1}" for i in range(args.players)] + [f"Bot{i + 1}" for i in range(args.bots)]
+    bots = {args.players + i: Bot(SKILLS[args.bot_skill], random.Random(rng.random())) for i in range(args.bots)}
+    race = Race(questions, n, screen.get_size(), rng=rng, category=category,
+                shared_water=args.shared_water, names=names, bots=bots)
+    pygame.display.set_caption(f"Text or Die - {args.players} players, {args.bots} bots")
+    timestep = gm.FixedTimestep()
+    next_loader = None
+    running = True
+    while running:
+        dt = gm.clock.tick(gm.RENDER_FPS) / 1000.0
+        # เหมือน Game_model.main(): จบเกมแล้วโหลดหมวดถัดไปใน thread กด R ก่อนเสร็จก็รอที่หน้าโหลด
+        if not race.over:
+            next_loader = None
+        elif next_loader is None:
+            next_loader = questions.preload([race.next_category()])
+        events = pygame.event.get()
+        if next_loader is not None and not next_loader.done() and gm.restart_pressed(events):
+            if not gm.wait_for_words(screen, next_loader):
+                break
+        running = timestep.advance(race, dt, events)
+        for name in race.pop_events():
+            gm.audio.play(name)
+        race.draw(screen, timestep.alpha)
+        pygame.display.flip()
+        gm.audio.start()
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    # LRU ของข้อความที่ render แล้ว key = (ข้อความ, ฟอนต์, สี) ข้อความเดิมไม่ต้อง render ใหม่ทุกเฟรม
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (text, font, color, antialias)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+text_cache = TextCache()
@@ -0,0 +1,335 @@
+import csv
+import json
+import marshal
+import os
+import threading
+from collections import OrderedDict
+
+# ไฟล์นี้ถูก import ได้ทั้งแบบ flat (เกมรันจากโฟลเดอร์นี้) และแบบ Final_game_model.word_dictionary
+if __package__:
+    from .fuzzy import FuzzyIndex
+else:
+    from fuzzy import FuzzyIndex
+
+
+class WordDictionary:
+    # คำตอบของหนึ่งหมวด: tuple ที่เรียงแล้ว (กินเมมน้อย ใช้สุ่ม/ไล่ดูได้) + frozenset ไว้เช็กคำตอบแบบ O(1)
+    __slots__ = ("words", "_lookup", "_trie", "_fuzzy", "_by_length")
+
+    def __init__(self, words=()):
+        cleaned = {w.strip().lower() for w in words}
+        cleaned.discard("")
+        self.words = tuple(sorted(cleaned))
+        self._lookup = frozenset(self.words)
+        self._trie = None
+        self._fuzzy = None
+        self._by_length = None
+
+    def __contains__(self, word):
+        return word in self._lookup
+
+    def __len__(self):
+        return len(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    @classmethod
+    def from_sorted(cls, words):
+        # สำหรับ words ที่ทำความสะอาดและเรียงมาแล้ว (เช่นจาก cache) ข้ามการ strip/sort
+        self = cls.__new__(cls)
+        self.words = tuple(words)
+        self._lookup = frozenset(self.words)
+        self._trie = None
+        self._fuzzy = None
+        self._by_length = None
+        return self
+
+    def trie(self):
+        # สร้างครั้งแรกที่เรียก หมวดที่โหลดผ่าน WordListLoader จะสร้างไว้ให้แล้วใน thread
+        if self._trie is None:
+            self._trie = build_trie(self.words)
+        return self._trie
+
+    def cursor(self):
+        return PrefixCursor(self.trie())
+
+    def fuzzy_index(self, max_distance=2):
+        # สร้างช้า (ต้องไล่ลบตัวอักษรทุกคำ) เลยควรเรียกตอนโหลดหมวด ไม่ใช่ตอนกด Enter
+        if self._fuzzy is None or self._fuzzy.max_distance < max_distance:
+            self._fuzzy = FuzzyIndex(self.words, max_distance)
+        return self._fuzzy
+
+    def by_length(self):
+        # [(ความยาว, tuple คำ), ...] เรียงจากยาวไปสั้น bot ใช้หยิบคำยาวโดยไม่ต้องไล่ทั้งหมวด
+        if self._by_length is None:
+            groups = {}
+            for word in self.words:
+                groups.setdefault(len(word), []).append(word)
+            self._by_length = [(n, tuple(groups[n])) for n in sorted(groups, reverse=True)]
+        return self._by_length
+
+    def __repr__(self):
+        return f"WordDictionary({len(self.words)} words)"
+
+
+def build_trie(words):
+    # แต่ละโหนดเป็น dict ตัวอักษร -> โหนดลูก คีย์ "" แปลว่ามีคำจบที่โหนดนี้
+    root = {}
+    for word in words:
+        node = root
+        for ch in word:
+            child = node.get(ch)
+            if child is None:
+                child = node[ch] = {}
+            node = child
+        node[""] = True
+    return root
+
+
+class PrefixCursor:
+    # เดินตาม trie ทีละตัวอักษรตามที่ผู้เล่นพิมพ์ พิมพ์/ลบหนึ่งตัว = O(1) ไม่ต้องไล่ทั้ง list
+    # เก็บสถานะต่อหนึ่งตัวที่พิมพ์ ลบตัวอักษรก็แค่ pop กลับไปสถานะก่อนหน้า: (node, base, dead)
+    #   node = โหนดหลังเดินครบทุกตัวรวมช่องว่าง (None = ช่องว่างที่ไม่มีคำไหนต่อได้)
+    #   base = โหนดหลังตัวอักษรสุดท้ายที่ไม่ใช่ช่องว่าง ใช้ตัดสิน status
+    # ช่องว่างหน้า/ท้ายเลยไม่ทำให้แดง เพราะตอนกด Enter เกมก็ strip ทิ้ง (ช่องว่างกลางคำ เช่น "new zealand" ยังเดินตาม trie)
+    EMPTY = "empty"
+    PREFIX = "prefix"
+    WORD = "word"
+    DEAD = "dead"
+
+    def __init__(self, root):
+        self.root = root
+        self.reset()
+
+    def reset(self):
+        self.stack = [(self.root, self.root, False)]
+
+    def push(self, ch):
+        if not ch:
+            return
+        node, base, dead = self.stack[-1]
+        if dead:
+            state = (node, base, True)
+        elif ch.isspace():
+            if base is self.root:
+                state = (self.root, self.root, False)  # ช่องว่างนำหน้า
+            else:
+                state = (node.get(ch) if node is not None else None, base, False)
+        else:
+            child = node.get(ch.lower()) if node is not None else None
+            state = (node, base, True) if child is None else (child, child, False)
+        self.stack.append(state)
+
+    def pop(self):
+        if len(self.stack) > 1:
+            self.stack.pop()
+
+    @property
+    def status(self):
+        _node, base, dead = self.stack[-1]
+        if dead:
+            return self.DEAD
+        if base is self.root:
+            return self.EMPTY
+        if "" in base:
+            return self.WORD
+        return self.PREFIX
+
+
+def as_word_dictionary(words):
+    if isinstance(words, WordDictionary):
+        return words
+    return WordDictionary(words)
+
+
+CACHE_DIR_NAME = "__wordcache__"
+CACHE_VERSION = 2
+
+
+def read_word_file(path):
+    words = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                w = line.strip().lower()
+                if w:
+                    words.append(w)
+    except FileNotFoundError:
+        print(f"Warning: {os.path.basename(path)} not found, using empty list.")
+    return words
+
+
+def read_csv_words(path):
+    # คอลัมน์แรกคือคำ ถ้าแถวแรกเป็นหัวตาราง "word" ก็ข้าม
+    words = []
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for i, row in enumerate(csv.reader(f)):
+            if not row:
+                continue
+            w = row[0].strip().lower()
+            if i == 0 and w == "word":
+                continue
+            if w:
+                words.append(w)
+    return words
+
+
+def read_jsonl_words(path):
+    # แต่ละบรรทัดเป็น "คำ" หรือ {"word": "คำ", ...}
+    words = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            item = json.loads(line)
+            if isinstance(item, dict):
+                item = item.get("word", "")
+            w = str(item).strip().lower()
+            if w:
+                words.append(w)
+    return words
+
+
+WORD_FILE_READERS = {
+    ".txt": read_word_file,
+    ".csv": read_csv_words,
+    ".jsonl": read_jsonl_words,
+}
+
+
+def _cache_path(path):
+    folder, name = os.path.split(path)
+    return os.path.join(folder, CACHE_DIR_NAME, name + ".marshal")
+
+
+def load_word_dictionary(path):
+    # ไฟล์ใหญ่ ๆ อ่านทีละบรรทัดช้า เลยเก็บคำที่เรียงแล้ว (ต่อกันเป็น string เดียว) เป็น marshal ไว้ข้าง ๆ
+    # cache ใช้ได้ตราบที่ mtime และขนาดไฟล์ต้นฉบับยังเท่าเดิม
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        print(f"Warning: {os.path.basename(path)} not found, using empty list.")
+        return WordDictionary()
+    stamp = (CACHE_VERSION, st.st_mtime_ns, st.st_size)
+
+    cache_path = _cache_path(path)
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, blob = marshal.loads(f.read())
+        if tuple(cached_stamp) == stamp:
+            return WordDictionary.from_sorted(blob.split("\n") if blob else ())
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    reader = WORD_FILE_READERS.get(os.path.splitext(path)[1].lower(), read_word_file)
+    dictionary = WordDictionary(reader(path))
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            marshal.dump((stamp, "\n".join(dictionary.words)), f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return dictionary
+
+
+def category_title(stem):
+    # fruits -> "Name a fruit", countries -> "Name a country", animals -> "Name an animal"
+    name = stem.replace("_", " ").replace("-", " ").strip().lower()
+    if name.endswith("ies"):
+        name = name[:-3] + "y"
+    elif name.endswith("s") and not name.endswith("ss"):
+        name = name[:-1]
+    article = "an" if name[:1] in "aeiou" else "a"
+    return f"Name {article} {name}"
+
+
+class CategoryRegistry:
+    # หาไฟล์คำศัพท์ (txt/csv/jsonl) ในโฟลเดอร์ แต่ยังไม่โหลด จะโหลดหมวดไหนก็ต่อเมื่อถูกเรียกใช้
+    # หมวดที่โหลดแล้วเก็บใน LRU จำกัดจำนวน มีหลายสิบหมวดก็ไม่ต้องถือไว้ในเมมทั้งหมด
+    # ใช้แทน dict ได้: keys(), [ชื่อหมวด], in, len()
+    def __init__(self, directory, max_loaded=8):
+        self.directory = directory
+        self.max_loaded = max_loaded
+        self.paths = {}
+        self.loaded = OrderedDict()
+        self.lock = threading.Lock()
+        self.scan()
+
+    def scan(self):
+        paths = {}
+        try:
+            entries = sorted(os.scandir(self.directory), key=lambda e: e.name)
+        except FileNotFoundError:
+            print(f"Warning: word directory {self.directory} not found.")
+            entries = []
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if entry.is_file() and ext.lower() in WORD_FILE_READERS:
+                paths[category_title(stem)] = entry.path
+        self.paths = paths
+        return self
+
+    def keys(self):
+        return self.paths.keys()
+
+    def names(self):
+        return list(self.paths)
+
+    def __contains__(self, name):
+        return name in self.paths
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def get(self, name):
+        with self.lock:
+            dictionary = self.loaded.get(name)
+            if dictionary is not None:
+                self.loaded.move_to_end(name)
+                return dictionary
+        dictionary = load_word_dictionary(self.paths[name])
+        with self.lock:
+            self.loaded[name] = dictionary
+            self.loaded.move_to_end(name)
+            while len(self.loaded) > self.max_loaded:
+                self.loaded.popitem(last=False)
+        return dictionary
+
+    __getitem__ = get
+
+    def preload(self, names, fuzzy_distance=None):
+        return WordListLoader(self, names, fuzzy_distance).start()
+
+
+class WordListLoader:
+    # โหลดหมวดคำศัพท์ใน thread แยก หน้าจอโหลดจะได้วาดต่อได้ไม่ค้าง
+    def __init__(self, registry, names, fuzzy_distance=None):
+        self.registry = registry
+        self.names = list(names)
+        self.fuzzy_distance = fuzzy_distance
+        self.thread = threading.Thread(target=self._run, name="word-list-loader", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _run(self):
+        # สร้าง trie (กับ fuzzy index ถ้าเปิด) ไว้ในนี้ด้วย GameState.restart เรียก cursor() แล้วจะไม่ต้องสร้างบน thread ที่วาดจอ
+        for name in self.names:
+            dictionary = self.registry.get(name)
+            dictionary.trie()
+            if self.fuzzy_distance:
+                dictionary.fuzzy_index(self.fuzzy_distance)
+
+    def done(self):
+        return not self.thread.is_alive()
+
+    def wait(self):
+        self.thread.join()
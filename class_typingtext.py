@@ -2,28 +2,52 @@
 #60% on develop
 import pygame
 
+from Final_game_model.text_cache import text_cache
+from Final_game_model.word_dictionary import as_word_dictionary
+
 class typingText:
-    def __init__(self, screen, font, question, valid_answers):
+    def __init__(self, screen, font, question, valid_answers, fuzzy=False, fuzzy_distance=2):
         self.screen = screen
         self.font = font
         self.question = question
-        self.valid_answers = set(ans.lower() for ans in valid_answers)
+        self.valid_answers = as_word_dictionary(valid_answers)
+        self.prefix = self.valid_answers.cursor()
         self.user_input = ""
         self.answer_valid = False
+        self.fuzzy = fuzzy # ยอมให้พิมพ์ผิดได้ไม่เกิน fuzzy_distance ตัว (คำตอบสั้นได้น้อยกว่านั้น ดู fuzzy.CHARS_PER_EDIT)
+        self.fuzzy_distance = fuzzy_distance
+        self.suggestion = ""
+        if fuzzy:
+            self.valid_answers.fuzzy_index(fuzzy_distance) # สร้าง index ไว้ก่อน กด Enter จะได้ไม่กระตุก
 
     def handle_event(self, event): # Typing function
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_BACKSPACE:
-                self.user_input = self.user_input[:-1]
+                if self.user_input:
+                    self.user_input = self.user_input[:-1]
+                    self.prefix.pop()
             elif event.key == pygame.K_RETURN:
                 self.answer_valid = self.check_answer() # Choice API or txt file
             else:
                 char = event.unicode
                 if char.isprintable():
                     self.user_input += char
+                    self.prefix.push(char)
 
     def check_answer(self): #Vocab checker
-        return self.user_input.lower() in self.valid_answers
+        word = self.user_input.strip().lower() # ช่องว่างหน้า/ท้ายไม่นับ เหมือน GameState.submit
+        self.suggestion = ""
+        if word in self.valid_answers:
+            return True
+        if self.fuzzy:
+            match = self.valid_answers.fuzzy_index(self.fuzzy_distance).lookup(word)
+            if match is not None:
+                self.suggestion = match[0]
+                return True
+        return False
+
+    def prefix_status(self): # live feedback ระหว่างพิมพ์: empty / prefix / word / dead
+        return self.prefix.status
 
     def get_answer_length(self): #Count letter
         return len(self.user_input)
@@ -31,17 +55,28 @@ class typingText:
     def draw(self): #Limited lette draw
         self.screen.fill((0, 0, 0))
 
-        question_surf = self.font.render(f"Question: {self.question}", True, (255, 255, 255))
-        input_surf = self.font.render(f"Your answer: {self.user_input}", True, (255, 255, 0))
+        question_surf = text_cache.render(self.font, f"Question: {self.question}", (255, 255, 255))
+        input_surf = text_cache.render(self.font, f"Your answer: {self.user_input}", (255, 255, 0))
         self.screen.blit(question_surf, (20, 20))
         self.screen.blit(input_surf, (20, 60))
 
-        if self.answer_valid:
+        if self.answer_valid and self.suggestion:
+            result_text = f"Did you mean {self.suggestion}? Length: {len(self.suggestion)}"
+            result_color = (255, 255, 0)
+        elif self.answer_valid:
             result_text = f"Correct! Length: {self.get_answer_length()}"
             result_color = (0, 255, 0)
         else:
             result_text = "Wrong spelling"
             result_color = (255, 255, 255)
 
-        result_surf = self.font.render(result_text, True, result_color)
+        result_surf = text_cache.render(self.font, result_text, result_color)
         self.screen.blit(result_surf, (20, 100))
+
+        status = self.prefix_status()
+        if status == "dead":
+            hint_surf = text_cache.render(self.font, "No word starts with this", (255, 100, 100))
+            self.screen.blit(hint_surf, (20, 140))
+        elif status != "empty":
+            hint_surf = text_cache.render(self.font, "Still a possible answer", (0, 255, 0))
+            self.screen.blit(hint_surf, (20, 140))
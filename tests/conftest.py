@@ -0,0 +1,30 @@
+# เทสต์รันแบบไม่มีจอ/เสียง (SDL dummy driver) จาก root ของ repo:  python -m pytest -q
+# โค้ดเกม import กันแบบ flat (รันจากโฟลเดอร์ Final_game_model) เลยเพิ่มโฟลเดอร์นั้นเข้า sys.path
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Final_game_model"))
+
+import pytest
+import Game_model as gm
+
+
+@pytest.fixture(scope="session")
+def questions():
+    return gm.get_questions()
+
+
+@pytest.fixture(scope="session")
+def screen():
+    surface = gm.init(audio_enabled=False)
+    yield surface
+    gm.pygame.quit()
+
+
+def snapshot(state):
+    # ทุกอย่างที่เกมเปลี่ยนระหว่างเล่น เทียบสองเกมว่าเหมือนกันเป๊ะไหม
+    return (state.chosen_category, state.score, state.round_number, state.game_over, state.time,
+            state.water.level, state.camera_y, tuple(state.tower.ys), tuple(state.tower.letters),
+            sorted(state.submitted_words))
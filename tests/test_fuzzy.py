@@ -0,0 +1,70 @@
+# FuzzyIndex (SymSpell) ต้องได้คำเดียวกับการไล่เทียบทุกคำในหมวดตรง ๆ ด้วยกติกาเดียวกัน
+import random
+import string
+
+import pytest
+from fuzzy import allowed_distance, edit_distance
+from word_dictionary import WordDictionary
+
+MAX_DISTANCE = 2
+
+
+@pytest.fixture(scope="module")
+def dictionary(questions):
+    words = set()
+    for name in questions.names():
+        words.update(questions[name].words)
+    return WordDictionary(words)
+
+
+def brute_force(words, text, max_distance):
+    best = None
+    for word in words:
+        limit = allowed_distance(word, max_distance)
+        dist = edit_distance(text, word, limit)
+        if dist <= limit and (best is None or (dist, word) < (best[1], best[0])):
+            best = (word, dist)
+    return best
+
+
+def typo(word, rng):
+    chars = list(word)
+    for _ in range(rng.randint(0, 2)):
+        kind = rng.randrange(3)
+        i = rng.randrange(len(chars))
+        if kind == 0:
+            chars[i] = rng.choice(string.ascii_lowercase)
+        elif kind == 1 and len(chars) > 1:
+            del chars[i]
+        else:
+            chars.insert(i, rng.choice(string.ascii_lowercase))
+    return "".join(chars)
+
+
+def test_index_matches_brute_force(dictionary):
+    index = dictionary.fuzzy_index(MAX_DISTANCE)
+    rng = random.Random(0)
+    for _ in range(300):
+        text = typo(rng.choice(dictionary.words), rng)
+        assert index.lookup(text) == brute_force(dictionary.words, text, MAX_DISTANCE), text
+
+
+def test_budget_follows_candidate_length(dictionary):
+    index = dictionary.fuzzy_index(MAX_DISTANCE)
+    assert index.lookup("pinaple") == ("pineapple", 2)
+    # คำในหมวดที่สั้นกว่า 4 ตัวต้องพิมพ์ตรงเป๊ะ
+    assert index.lookup("ab") is None
+    assert index.lookup("aaa") is None
+
+
+def test_short_nonsense_mostly_rejected(dictionary):
+    index = dictionary.fuzzy_index(MAX_DISTANCE)
+    rng = random.Random(1)
+    tried = accepted = 0
+    for _ in range(2000):
+        text = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 4)))
+        if text in dictionary:
+            continue
+        tried += 1
+        accepted += index.lookup(text) is not None
+    assert accepted < tried * 0.02
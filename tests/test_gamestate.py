@@ -0,0 +1,65 @@
+# GameState ต้องได้ผลเดิมทุกครั้งจาก seed + input เดิม ไม่ว่าจะวาดที่กี่ FPS (FixedTimestep)
+import random
+
+import Game_model as gm
+from bots import SKILLS, Bot
+from conftest import snapshot
+
+STEPS = 60 * 90  # 90 วินาทีในเกม
+
+
+class BotDriver:
+    # ให้ bot กดปุ่มข้างใน step จะได้ผูก input กับเลข step ไม่ใช่เวลาจริงของเฟรม
+    def __init__(self, state, bot, max_steps):
+        self.state = state
+        self.bot = bot
+        self.max_steps = max_steps
+        self.steps = 0
+
+    def step(self, dt, events=()):
+        if self.steps >= self.max_steps:
+            return True
+        self.steps += 1
+        return self.state.step(dt, list(events) + self.bot.update(dt, self.state))
+
+
+def new_driver(questions, seed):
+    rng, category = gm.new_game_rng(questions, seed)
+    state = gm.GameState(questions, rng=rng, category=category)
+    return BotDriver(state, Bot(SKILLS["hard"], random.Random(seed)), STEPS)
+
+
+def play_fixed(questions, seed):
+    driver = new_driver(questions, seed)
+    while driver.steps < STEPS:
+        driver.step(gm.FIXED_DT)
+    return driver.state
+
+
+def play_frames(questions, seed, frame_rng):
+    # เฟรมยาวไม่เท่ากันแบบสุ่ม 20-240 FPS
+    driver = new_driver(questions, seed)
+    timestep = gm.FixedTimestep()
+    while driver.steps < STEPS:
+        timestep.advance(driver, frame_rng.uniform(1 / 240, 1 / 20))
+    return driver.state
+
+
+def test_same_seed_same_game(questions):
+    assert snapshot(play_fixed(questions, 3)) == snapshot(play_fixed(questions, 3))
+
+
+def test_result_does_not_depend_on_frame_rate(questions):
+    for seed in range(4):
+        expected = snapshot(play_fixed(questions, seed))
+        for frame_seed in range(3):
+            assert snapshot(play_frames(questions, seed, random.Random(frame_seed))) == expected
+
+
+def test_restart_picks_next_category(questions):
+    rng, category = gm.new_game_rng(questions, 11)
+    state = gm.GameState(questions, rng=rng, category=category)
+    for _ in range(5):
+        expected = state.next_category()
+        state.restart()
+        assert state.chosen_category == expected
@@ -0,0 +1,47 @@
+# DirtyRectRenderer วาดแค่บางส่วนของจอ ผลต้องเหมือนวาดใหม่ทั้งจอด้วย draw_game() ทุก pixel
+# ตรึง get_ticks ไว้ คลื่นน้ำจะได้ไม่ขยับระหว่างสองรอบที่วาด
+import random
+
+import pygame
+import Game_model as gm
+
+SEEDS = 8  # seed 7 เคยเจอเคสขอบกล่องพิมพ์โดน clip ตัดตอนเกมจบ
+FRAMES = 250
+
+
+def key(k, unicode=""):
+    return pygame.event.Event(pygame.KEYDOWN, key=k, unicode=unicode, mod=0)
+
+
+def test_dirty_rects_match_full_redraw(questions, screen, monkeypatch):
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: 1000)
+    reference = pygame.Surface(screen.get_size()).convert()
+    mismatches = []
+    for seed in range(SEEDS):
+        rng, category = gm.new_game_rng(questions, seed)
+        state = gm.GameState(questions, rng=rng, category=category)
+        renderer = gm.DirtyRectRenderer(screen)
+        script = random.Random(seed)
+        words = state.current_question.words
+        typing = []
+        for frame in range(FRAMES):
+            events = []
+            if not typing and script.random() < 0.05:
+                if script.random() < 0.8 or state.round_number == 1 and script.random() < 0.9:
+                    word = script.choice(words)
+                else:
+                    word = "qzx"
+                typing = list(word) + ["\r"]
+            if state.game_over and script.random() < 0.02:
+                events.append(key(pygame.K_r, "r"))
+            elif typing and script.random() < 0.5:
+                ch = typing.pop(0)
+                events.append(key(pygame.K_RETURN, "\r") if ch == "\r" else key(0, ch))
+            state.step(gm.FIXED_DT, events)
+            state.pop_events()
+            alpha = script.random()
+            renderer.render(state, alpha)
+            gm.draw_game(reference, state, alpha)
+            if pygame.image.tostring(reference, "RGB") != pygame.image.tostring(screen, "RGB"):
+                mismatches.append((seed, frame))
+    assert mismatches == []
@@ -0,0 +1,54 @@
+# อัด replay จากเกมที่ bot เล่น แล้วเล่นซ้ำต้องได้เกมเดิมทุกอย่าง
+import random
+
+import pytest
+import Game_model as gm
+import replay
+from bots import SKILLS, Bot
+from conftest import snapshot
+
+STEPS = 60 * 60
+
+
+def record(questions, seed, **state_args):
+    rng, category = gm.new_game_rng(questions, seed)
+    state = gm.GameState(questions, rng=rng, category=category, **state_args)
+    recorder = replay.ReplayRecorder(state, seed, gm.FIXED_DT)
+    bot = Bot(SKILLS["normal"], random.Random(seed))
+    for _ in range(STEPS):
+        events = bot.update(gm.FIXED_DT, state)
+        if state.game_over and recorder.steps % 300 == 0:
+            # เล่นต่อหลังจม ให้ replay มีการกด R (สุ่มหมวดใหม่) ด้วย
+            events.append(gm.pygame.event.Event(gm.pygame.KEYDOWN, key=gm.pygame.K_r, unicode="r", mod=0))
+        recorder.step(gm.FIXED_DT, events)
+        state.pop_events()
+    return recorder, state
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_round_trip(questions, compress):
+    for seed in range(4):
+        recorder, state = record(questions, seed)
+        loaded = replay.Replay.from_bytes(recorder.to_bytes(compress))
+        assert loaded.seed == seed
+        assert loaded.total_steps == STEPS
+        assert snapshot(replay.play_headless(loaded, questions)) == snapshot(state)
+
+
+def test_save_and_load(questions, tmp_path):
+    recorder, state = record(questions, 5)
+    path = recorder.save(str(tmp_path / "game.todr"))
+    assert snapshot(replay.play_headless(replay.Replay.load(path), questions)) == snapshot(state)
+
+
+def test_different_balance_is_refused(questions):
+    recorder, _state = record(questions, 6, percent_step=gm.PERCENT_STEP * 2)
+    loaded = replay.Replay.from_bytes(recorder.to_bytes())
+    with pytest.raises(replay.ReplayMismatch):
+        replay.play_headless(loaded, questions)
+    replay.play_headless(loaded, questions, strict=False)
+
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError):
+        replay.Replay.from_bytes(b"PNG\x00\x01\x02")
@@ -3,6 +3,10 @@ import pygame
 import math
 import sys
 
+from Final_game_model.running_stats import RunningStats
+from Final_game_model.text_cache import text_cache
+from Final_game_model.word_dictionary import as_word_dictionary
+
 pygame.init()
 
 WIDTH, HEIGHT = 800, 500
@@ -33,7 +37,7 @@ big_font = pygame.font.SysFont("arial", 36)
 class Water:
     """
     Controls water level, animation, and cumulative average rise:
-    - word_lengths: list of lengths seen so far
+    - word_stats: running count/sum of lengths seen so far
     - add_word(length): append and start rise by average*WATER_RISE_PIXELS_PER_LETTER
     """
 
@@ -50,12 +54,12 @@ class Water:
         self.anim_dur = WATER_ANIM_DURATION
 
         # cumulative words data
-        self.word_lengths = []
+        self.word_stats = RunningStats()
 
     def add_word(self, word_length: int):
         """Record a new word length and start the rise based on the average."""
-        self.word_lengths.append(max(1, int(word_length)))  # at least 1
-        avg_len = sum(self.word_lengths) / len(self.word_lengths)
+        self.word_stats.add(max(1, int(word_length)))  # at least 1
+        avg_len = self.word_stats.mean
         rise_px = avg_len * WATER_RISE_PIXELS_PER_LETTER
         self.start_rise(rise_px)
 
@@ -113,7 +117,7 @@ class typingText:
         self.screen = screen
         self.font = font
         self.question = question
-        self.valid_answers = set(ans.lower() for ans in valid_answers)
+        self.valid_answers = as_word_dictionary(valid_answers)
         self.user_input = ""
         self.answer_valid = False
         self.submitted = False  # True when Enter pressed (not yet consumed)
@@ -156,8 +160,8 @@ class typingText:
 
     def draw(self):
         # Draw question and current typed text (this method draws onto self.screen)
-        question_surf = self.font.render(f"Question: {self.question}", True, (255, 255, 255))
-        input_surf = self.font.render(f"Your answer: {self.user_input}", True, (255, 255, 0))
+        question_surf = text_cache.render(self.font, f"Question: {self.question}", (255, 255, 255))
+        input_surf = text_cache.render(self.font, f"Your answer: {self.user_input}", (255, 255, 0))
         self.screen.blit(question_surf, (20, 20))
         self.screen.blit(input_surf, (20, 60))
 
@@ -169,7 +173,7 @@ class typingText:
             else:
                 result_text = "Wrong spelling"
                 result_color = (255, 100, 100)
-            result_surf = self.font.render(result_text, True, result_color)
+            result_surf = text_cache.render(self.font, result_text, result_color)
             self.screen.blit(result_surf, (20, 100))
 
 
@@ -204,7 +208,7 @@ def main():
             if valid:
                 # add word to water (water will compute avg and rise)
                 water.add_word(len(word))
-                info_message = f"Submitted '{word}' — water will rise (avg of {len(water.word_lengths)} entries)"
+                info_message = f"Submitted '{word}' — water will rise (avg of {water.word_stats.count} entries)"
             else:
                 info_message = f"'{word}' is not a valid answer"
 
@@ -215,7 +219,7 @@ def main():
         typer.draw()
         if water.visible:
             lvl = int(water.level_y)
-            hud = font.render(f"Water Y: {lvl} px  (words: {len(water.word_lengths)})", True, (220, 220, 220))
+            hud = font.render(f"Water Y: {lvl} px  (words: {water.word_stats.count})", True, (220, 220, 220))
         else:
             hud = font.render("Water hidden (no submissions yet)", True, (220, 220, 220))
         screen.blit(hud, (20, 140))
@@ -235,6 +239,10 @@ import pygame
 import math
 import sys
 
+from Final_game_model.running_stats import RunningStats
+from Final_game_model.text_cache import text_cache
+from Final_game_model.word_dictionary import as_word_dictionary
+
 pygame.init()
 
 # ----- Config / Constants -----
@@ -271,11 +279,11 @@ class Water:
         self.target_y = self.level_y
         self.anim_time = 0.0
         self.anim_dur = WATER_ANIM_DURATION
-        self.word_lengths = []
+        self.word_stats = RunningStats()
 
     def add_word(self, word_length: int):
-        self.word_lengths.append(max(1, int(word_length)))
-        avg_len = sum(self.word_lengths) / len(self.word_lengths)
+        self.word_stats.add(max(1, int(word_length)))
+        avg_len = self.word_stats.mean
         rise_px = avg_len * WATER_RISE_PIXELS_PER_LETTER
         self.start_rise(rise_px)
 
@@ -319,6 +327,22 @@ class Water:
                 pygame.draw.polygon(surf, SURFACE_HIGHLIGHT, poly)
 
 
+_tower_block_sprites = {}
+
+
+def get_tower_block_sprite(color, width, height, border_color=(40, 40, 40)):
+    # บล็อกตึกหน้าตาเหมือนกันหมด สร้างรูปครั้งเดียวแล้ว blit ซ้ำ
+    key = (color, width, height)
+    sprite = _tower_block_sprites.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((width, height)).convert()
+        rect = sprite.get_rect()
+        pygame.draw.rect(sprite, color, rect)
+        pygame.draw.rect(sprite, border_color, rect, 1)
+        _tower_block_sprites[key] = sprite
+    return sprite
+
+
 class Player:
     def __init__(self, name, x):
         self.name = name
@@ -341,11 +365,14 @@ class Player:
 
     def draw(self, surf, base_y):
         # Draw tower
-        for i in range(self.tower_blocks):
+        sprite = get_tower_block_sprite(self.color, BLOCK_SIZE * 2, BLOCK_SIZE)
+        block_x = self.x - BLOCK_SIZE
+        # วาดเฉพาะบล็อกที่อยู่ในจอ
+        first = max(0, (base_y - surf.get_height()) // BLOCK_SIZE)
+        last = min(self.tower_blocks, -(-base_y // BLOCK_SIZE))
+        for i in range(first, last):
             block_y = base_y - (i + 1) * BLOCK_SIZE
-            rect = pygame.Rect(self.x - BLOCK_SIZE, block_y, BLOCK_SIZE * 2, BLOCK_SIZE)
-            pygame.draw.rect(surf, self.color, rect)
-            pygame.draw.rect(surf, (40, 40, 40), rect, 1)
+            surf.blit(sprite, (block_x, block_y))
 
         # Platform and player circle
         platform_y = base_y - self.height_px - BLOCK_SIZE
@@ -376,7 +403,7 @@ class TypingBox:
         self.screen = screen
         self.font = font
         self.question = question
-        self.valid_answers = set(ans.lower() for ans in valid_answers)
+        self.valid_answers = as_word_dictionary(valid_answers)
         self.user_input = ""
         self.answer_valid = False
         self.submitted = False
@@ -407,8 +434,8 @@ class TypingBox:
         return True, valid, word
 
     def draw(self):
-        q_s = self.font.render(f"Question: {self.question}", True, (255, 255, 255))
-        i_s = self.font.render(f"Your answer: {self.user_input}", True, (255, 255, 0))
+        q_s = text_cache.render(self.font, f"Question: {self.question}", (255, 255, 255))
+        i_s = text_cache.render(self.font, f"Your answer: {self.user_input}", (255, 255, 0))
         self.screen.blit(q_s, (20, 20))
         self.screen.blit(i_s, (20, 60))
 
@@ -458,7 +485,7 @@ def main():
         typer.draw()
 
         hud = font.render(
-            f"Water Y: {int(water.level_y) if water.visible else 'hidden'}  (words: {len(water.word_lengths)})",
+            f"Water Y: {int(water.level_y) if water.visible else 'hidden'}  (words: {water.word_stats.count})",
             True,
             (220, 220, 220),
         )
@@ -480,6 +507,10 @@ import pygame
 import math
 import sys
 
+from Final_game_model.running_stats import RunningStats
+from Final_game_model.text_cache import text_cache
+from Final_game_model.word_dictionary import as_word_dictionary
+
 pygame.init()
 
 # ----- Config / Constants -----
@@ -516,11 +547,11 @@ class Water:
         self.target_y = self.level_y
         self.anim_time = 0.0
         self.anim_dur = WATER_ANIM_DURATION
-        self.word_lengths = []
+        self.word_stats = RunningStats()
 
     def add_word(self, word_length: int):
-        self.word_lengths.append(max(1, int(word_length)))
-        avg_len = sum(self.word_lengths) / len(self.word_lengths)
+        self.word_stats.add(max(1, int(word_length)))
+        avg_len = self.word_stats.mean
         rise_px = avg_len * WATER_RISE_PIXELS_PER_LETTER
         self.start_rise(rise_px)
 
@@ -564,6 +595,22 @@ class Water:
                 pygame.draw.polygon(surf, SURFACE_HIGHLIGHT, poly)
 
 
+_tower_block_sprites = {}
+
+
+def get_tower_block_sprite(color, width, height, border_color=(40, 40, 40)):
+    # บล็อกตึกหน้าตาเหมือนกันหมด สร้างรูปครั้งเดียวแล้ว blit ซ้ำ
+    key = (color, width, height)
+    sprite = _tower_block_sprites.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((width, height)).convert()
+        rect = sprite.get_rect()
+        pygame.draw.rect(sprite, color, rect)
+        pygame.draw.rect(sprite, border_color, rect, 1)
+        _tower_block_sprites[key] = sprite
+    return sprite
+
+
 class Player:
     def __init__(self, name, x):
         self.name = name
@@ -586,11 +633,14 @@ class Player:
 
     def draw(self, surf, base_y):
         # Draw tower
-        for i in range(self.tower_blocks):
+        sprite = get_tower_block_sprite(self.color, BLOCK_SIZE * 2, BLOCK_SIZE)
+        block_x = self.x - BLOCK_SIZE
+        # วาดเฉพาะบล็อกที่อยู่ในจอ
+        first = max(0, (base_y - surf.get_height()) // BLOCK_SIZE)
+        last = min(self.tower_blocks, -(-base_y // BLOCK_SIZE))
+        for i in range(first, last):
             block_y = base_y - (i + 1) * BLOCK_SIZE
-            rect = pygame.Rect(self.x - BLOCK_SIZE, block_y, BLOCK_SIZE * 2, BLOCK_SIZE)
-            pygame.draw.rect(surf, self.color, rect)
-            pygame.draw.rect(surf, (40, 40, 40), rect, 1)
+            surf.blit(sprite, (block_x, block_y))
 
         # Platform and player circle
         platform_y = base_y - self.height_px - BLOCK_SIZE
@@ -621,7 +671,7 @@ class TypingBox:
         self.screen = screen
         self.font = font
         self.question = question
-        self.valid_answers = set(ans.lower() for ans in valid_answers)
+        self.valid_answers = as_word_dictionary(valid_answers)
         self.user_input = ""
         self.answer_valid = False
         self.submitted = False
@@ -652,8 +702,8 @@ class TypingBox:
         return True, valid, word
 
     def draw(self):
-        q_s = self.font.render(f"Question: {self.question}", True, (255, 255, 255))
-        i_s = self.font.render(f"Your answer: {self.user_input}", True, (255, 255, 0))
+        q_s = text_cache.render(self.font, f"Question: {self.question}", (255, 255, 255))
+        i_s = text_cache.render(self.font, f"Your answer: {self.user_input}", (255, 255, 0))
         self.screen.blit(q_s, (20, 20))
         self.screen.blit(i_s, (20, 60))
 
@@ -703,7 +753,7 @@ def main():
         typer.draw()
 
         hud = font.render(
-            f"Water Y: {int(water.level_y) if water.visible else 'hidden'}  (words: {len(water.word_lengths)})",
+            f"Water Y: {int(water.level_y) if water.visible else 'hidden'}  (words: {water.word_stats.count})",
             True,
             (220, 220, 220),
         )